@@ -11,7 +11,12 @@ Three analyzers + a facade (ContentAnalysisEngine).
 
 from __future__ import annotations
 
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 from epistemix.models import Anomaly, Finding, GapType, NegativePostulate, Severity
@@ -21,34 +26,70 @@ from epistemix.models import Anomaly, Finding, GapType, NegativePostulate, Sever
 # DATA STRUCTURES
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class StructuralFact:
     """A known structural fact that theories must address.
 
     Example: "5 individuals found in tomb" with items
-    ["woman ~60", "man 35-45 #1", "man 35-45 #2", "newborn", "cremated remains"]
+    ("woman ~60", "man 35-45 #1", "man 35-45 #2", "newborn", "cremated remains")
+
+    Both fields accept any sequence or mapping at construction. items is
+    then kept as a tuple and addressed_by as a read-only view, so the
+    addressed bitmask cannot go stale; record later addressing with
+    register_addressing().
     """
     description: str
-    items: list[str] = field(default_factory=list)
-    addressed_by: dict[str, list[str]] = field(default_factory=dict)
+    items: tuple[str, ...] = ()
+    addressed_by: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    # Theory -> items it addresses; addressed_by is a read-only view of it
+    _addressed: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    # Bit i stands for items[i]; lowercased item -> its bit(s)
+    _item_bits: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _addressed_mask: int = field(
+        default=0, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.items = tuple(self.items)
+        for i, item in enumerate(self.items):
+            key = item.lower()
+            self._item_bits[key] = self._item_bits.get(key, 0) | (1 << i)
+        for theory, items in self.addressed_by.items():
+            self._addressed[theory] = tuple(items)
+            self._mark_addressed(items)
+        self.addressed_by = MappingProxyType(self._addressed)
+
+    def _mark_addressed(self, items_addressed: list[str]) -> None:
+        for item in items_addressed:
+            self._addressed_mask |= self._item_bits.get(item.lower(), 0)
 
     def register_addressing(self, theory: str, items_addressed: list[str]) -> None:
         """Record which items a theory addresses."""
-        self.addressed_by.setdefault(theory, []).extend(items_addressed)
+        self._addressed[theory] = (
+            *self._addressed.get(theory, ()), *items_addressed,
+        )
+        self._mark_addressed(items_addressed)
+
+    @property
+    def unaddressed_mask(self) -> int:
+        """Bitmask of items not addressed by any theory."""
+        return ((1 << len(self.items)) - 1) & ~self._addressed_mask
 
     @property
     def unaddressed_items(self) -> list[str]:
         """Items not addressed by any theory."""
-        all_addressed = set()
-        for items in self.addressed_by.values():
-            all_addressed.update(i.lower() for i in items)
+        mask = self.unaddressed_mask
         return [
-            item for item in self.items
-            if item.lower() not in all_addressed
+            item for i, item in enumerate(self.items)
+            if mask >> i & 1
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class TheoryPosition:
     """A theory's position on a question, with evidence."""
     question: str
@@ -58,7 +99,7 @@ class TheoryPosition:
     source_type: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result tracking for a query execution."""
     query: str
@@ -81,14 +122,24 @@ class StructuralAbsenceDetector:
         """Register a structural fact."""
         self.facts.append(fact)
 
+    @property
+    def version(self) -> tuple[int, ...]:
+        """Changes whenever generate_anomalies() could change.
+
+        Facts can still be addressed after registration, so their
+        masks are part of the version.
+        """
+        return (len(self.facts), *(f.unaddressed_mask for f in self.facts))
+
     def generate_anomalies(self) -> list[Anomaly]:
         """Generate anomalies for unaddressed facts."""
         anomalies: list[Anomaly] = []
 
         for fact in self.facts:
-            unaddressed = fact.unaddressed_items
-            if unaddressed and fact.items:
-                ratio = len(unaddressed) / len(fact.items)
+            n_unaddressed = fact.unaddressed_mask.bit_count()
+            if n_unaddressed:
+                unaddressed = fact.unaddressed_items
+                ratio = n_unaddressed / len(fact.items)
                 severity = (
                     Severity.CRITICAL if ratio > 0.5
                     else Severity.HIGH if ratio > 0.3
@@ -119,29 +170,47 @@ class ConvergenceAnalyzer:
     """
 
     def __init__(self) -> None:
-        self.positions: list[TheoryPosition] = []
+        self._positions: list[TheoryPosition] = []
+        # Normalized answer -> number of positions giving it
+        self._answer_counts: Counter[str] = Counter()
+        # question -> answer -> (first theory giving it, number of theories);
+        # only lone advocates are ever named, so later theories aren't kept
+        self._by_question: dict[str, dict[str, tuple[str, int]]] = {}
 
     def register_position(self, position: TheoryPosition) -> None:
         """Register a theory's position on a question."""
-        self.positions.append(position)
+        self._positions.append(position)
+        self._answer_counts[sys.intern(position.answer.lower().strip())] += 1
+        answers = self._by_question.setdefault(position.question.lower(), {})
+        answer = position.answer.lower()
+        first_theory, n = answers.get(answer, (position.theory, 0))
+        answers[answer] = (first_theory, n + 1)
 
     def uniformity_score(self) -> float:
         """0.0 = completely diverse, 1.0 = complete agreement.
 
         Calculated as 1 - (unique_answers / total_positions).
         """
-        if not self.positions:
+        if not self._positions:
             return 0.0
 
-        answers = [p.answer.lower().strip() for p in self.positions]
-        unique = len(set(answers))
-        return 1.0 - (unique / len(answers))
+        return 1.0 - (len(self._answer_counts) / len(self._positions))
+
+    @property
+    def positions(self) -> tuple[TheoryPosition, ...]:
+        """Registered positions, in order; add with register_position()."""
+        return tuple(self._positions)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever generate_anomalies() could change."""
+        return len(self._positions)
 
     def generate_anomalies(self) -> list[Anomaly]:
         """Generate convergence/divergence anomalies."""
         anomalies: list[Anomaly] = []
 
-        if len(self.positions) < 2:
+        if len(self._positions) < 2:
             return anomalies
 
         score = self.uniformity_score()
@@ -169,18 +238,12 @@ class ConvergenceAnalyzer:
             ))
 
         # Check for isolated advocates (theory with only one voice)
-        by_question: dict[str, dict[str, list[str]]] = {}
-        for p in self.positions:
-            q = p.question.lower()
-            by_question.setdefault(q, {})
-            by_question[q].setdefault(p.answer.lower(), []).append(p.theory)
-
-        for question, answers in by_question.items():
-            for answer, theories in answers.items():
-                if len(theories) == 1:
+        for question, answers in self._by_question.items():
+            for answer, (theory, n_theories) in answers.items():
+                if n_theories == 1:
                     anomalies.append(Anomaly(
                         description=(
-                            f"Isolated advocate: only '{theories[0]}' "
+                            f"Isolated advocate: only '{theory}' "
                             f"answers '{question}' with '{answer}'"
                         ),
                         gap_type=GapType.VOICE,
@@ -204,51 +267,78 @@ class EmptyQueryAnalyzer:
     """
 
     def __init__(self) -> None:
-        self.results: list[QueryResult] = []
+        self._results: list[QueryResult] = []
+        # Aggregates kept up to date on register, so the analyses below
+        # never have to walk the full result stream.
+        # Per-language counters as parallel int columns; _lang_index maps
+        # a language code to its slot (first-seen order).
+        self._lang_index: dict[str, int] = {}
+        self._totals = array("q")
+        self._empties = array("q")
+        self._empty_queries: dict[str, list[str]] = {}
+        self._n_empty: int = 0
 
     def register_result(self, result: QueryResult) -> None:
         """Register a query result."""
-        self.results.append(result)
+        self._results.append(result)
+        # Interned so repeated codes hash/compare by identity in the maps
+        lang = sys.intern(result.language)
+        i = self._lang_index.get(lang)
+        if i is None:
+            i = self._lang_index[lang] = len(self._totals)
+            self._totals.append(0)
+            self._empties.append(0)
+        self._totals[i] += 1
+        if result.empty:
+            self._empties[i] += 1
+            self._n_empty += 1
+            self._empty_queries.setdefault(lang, []).append(result.query)
 
     def register_from_findings(
         self, query: str, language: str, findings: list[Finding]
     ) -> None:
         """Convenience: register from query + findings list."""
-        self.results.append(QueryResult(
+        self.register_result(QueryResult(
             query=query,
             language=language,
             findings_count=len(findings),
             empty=len(findings) == 0,
         ))
 
+    @property
+    def results(self) -> tuple[QueryResult, ...]:
+        """Registered results, in order; add with register_result()."""
+        return tuple(self._results)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever generate_anomalies() could change."""
+        return len(self._results)
+
     def language_productivity(self) -> dict[str, dict[str, int]]:
         """Per-language query statistics."""
-        stats: dict[str, dict[str, int]] = {}
-        for r in self.results:
-            lang = r.language
-            if lang not in stats:
-                stats[lang] = {"total": 0, "empty": 0, "productive": 0}
-            stats[lang]["total"] += 1
-            if r.empty:
-                stats[lang]["empty"] += 1
-            else:
-                stats[lang]["productive"] += 1
-        return stats
+        return {
+            lang: {
+                "total": self._totals[i],
+                "empty": self._empties[i],
+                "productive": self._totals[i] - self._empties[i],
+            }
+            for lang, i in self._lang_index.items()
+        }
 
     def generate_anomalies(self) -> list[Anomaly]:
         """Generate anomalies from empty query patterns."""
         anomalies: list[Anomaly] = []
 
-        stats = self.language_productivity()
-
-        for lang, counts in stats.items():
-            if counts["total"] >= 2:
-                empty_ratio = counts["empty"] / counts["total"]
+        for lang, i in self._lang_index.items():
+            total, empty = self._totals[i], self._empties[i]
+            if total >= 2:
+                empty_ratio = empty / total
                 if empty_ratio > 0.6:
                     anomalies.append(Anomaly(
                         description=(
                             f"Language '{lang}' has {empty_ratio:.0%} empty "
-                            f"queries ({counts['empty']}/{counts['total']})"
+                            f"queries ({empty}/{total})"
                         ),
                         gap_type=GapType.EMPTY_QUERY_PATTERN,
                         severity=Severity.HIGH,
@@ -256,12 +346,13 @@ class EmptyQueryAnalyzer:
                             f"Rephrase queries in {lang} or use "
                             "different terminology"
                         ),
+                        language=lang,
                     ))
 
         # Overall empty ratio
-        total = len(self.results)
+        total = len(self._results)
         if total >= 5:
-            empty = sum(1 for r in self.results if r.empty)
+            empty = self._n_empty
             if empty / total > 0.5:
                 anomalies.append(Anomaly(
                     description=(
@@ -276,7 +367,9 @@ class EmptyQueryAnalyzer:
         return anomalies
 
     # v3 Phase 2: walled-garden / access-barrier languages
-    _ACCESS_BARRIER_LANGUAGES = {"zh", "ar", "ja", "ko"}
+    _ACCESS_BARRIER_LANGUAGES: frozenset[str] = frozenset(
+        {"zh", "ar", "ja", "ko"}
+    )
 
     def generate_negative_postulates(
         self, cycle: int = 0,
@@ -287,19 +380,16 @@ class EmptyQueryAnalyzer:
         hypotheses about why they returned nothing.
         """
         postulates: list[NegativePostulate] = []
-        stats = self.language_productivity()
 
-        for lang, counts in stats.items():
-            if counts["total"] < 2:
+        for lang, i in self._lang_index.items():
+            total, empty = self._totals[i], self._empties[i]
+            if total < 2:
                 continue
-            empty_ratio = counts["empty"] / counts["total"]
+            empty_ratio = empty / total
             if empty_ratio <= 0.5:
                 continue
 
-            empty_queries = [
-                r.query for r in self.results
-                if r.language == lang and r.empty
-            ]
+            empty_queries = self._empty_queries.get(lang, [])
 
             # Determine possible reason
             if lang in self._ACCESS_BARRIER_LANGUAGES:
@@ -308,7 +398,7 @@ class EmptyQueryAnalyzer:
                     f"Try specialized databases for {lang} "
                     f"(e.g., CNKI for zh, Shamaa for ar)"
                 )
-            elif counts["productive"] == 0:
+            elif empty == total:
                 reason = "wrong_terminology"
                 reformulation = (
                     f"Rephrase using local terminology in {lang}"
@@ -342,14 +432,28 @@ class ContentAnalysisEngine:
         self.structural = StructuralAbsenceDetector()
         self.convergence = ConvergenceAnalyzer()
         self.empty_queries = EmptyQueryAnalyzer()
+        self._cached_versions: tuple | None = None
+        self._cached_anomalies: tuple[Anomaly, ...] = ()
 
     def generate_all_anomalies(self) -> list[Anomaly]:
-        """Run all analyzers and collect anomalies."""
-        anomalies: list[Anomaly] = []
-        anomalies.extend(self.structural.generate_anomalies())
-        anomalies.extend(self.convergence.generate_anomalies())
-        anomalies.extend(self.empty_queries.generate_anomalies())
-        return anomalies
+        """Run all analyzers and collect anomalies.
+
+        Re-runs the analyzers only if something was registered since
+        the last call; otherwise returns the previous anomalies.
+        """
+        versions = (
+            self.structural.version,
+            self.convergence.version,
+            self.empty_queries.version,
+        )
+        if versions != self._cached_versions:
+            self._cached_anomalies = (
+                *self.structural.generate_anomalies(),
+                *self.convergence.generate_anomalies(),
+                *self.empty_queries.generate_anomalies(),
+            )
+            self._cached_versions = versions
+        return list(self._cached_anomalies)
 
     def generate_negative_postulates(
         self, cycle: int = 0,
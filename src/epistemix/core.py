@@ -22,6 +22,10 @@ Classes:
 
 from __future__ import annotations
 
+import functools
+import re
+import sys
+from dataclasses import replace
 from typing import Any
 
 from epistemix.models import (
@@ -65,6 +69,18 @@ DECAY_RATES: dict[str, float] = {
     "default": 0.02,
 }
 
+# Case-insensitive index over TRANSLITERATIONS for _transliterate
+_TRANSLITERATIONS_BY_NAME: dict[str, dict[str, str]] = {
+    name.lower(): translations
+    for name, translations in TRANSLITERATIONS.items()
+}
+
+_KEY_TERM_SPLIT_RE = re.compile(r"[\s,;.\-/]+")
+
+# classify_entity_name() returns value strings; map them without going
+# through the Enum constructor on every mentioned entity
+_ENTITY_TYPE_BY_VALUE: dict[str, EntityType] = {t.value: t for t in EntityType}
+
 # Confidence calculation constants (Phase 1)
 _CONFIDENCE_BASE = {1: 0.2, 2: 0.4, 3: 0.6, 4: 0.7, 5: 0.8}
 _MAX_LANGUAGE_BONUS = 0.2
@@ -86,6 +102,10 @@ class DynamicPostulates:
         self.country = country
         self.topic = topic
         self.discipline = discipline
+        # Per-month confidence decay for this discipline (Phase 7)
+        self._decay_rate = DECAY_RATES.get(
+            discipline.lower(), DECAY_RATES["default"]
+        )
         self.discovery_year: int = 0
         self.ongoing: bool = True
 
@@ -101,6 +121,9 @@ class DynamicPostulates:
 
         # v3: Weighted postulates (Phase 1)
         self.weighted_postulates: dict[str, WeightedPostulate] = {}
+        # Entities by stripped lowercase display name, first one wins.
+        # Filled by _register_entity, the only place entities are added.
+        self._entities_by_name: dict[str, Entity] = {}
 
         # v3: Negative postulates (Phase 2)
         self.negative_postulates: list[NegativePostulate] = []
@@ -148,28 +171,35 @@ class DynamicPostulates:
             self.theories.append(finding.theory_supported)
 
         # Process mentioned entities
+        # Resolve the canonical key once per name; only names not seen
+        # before need classifying and registering.
         for name in finding.entities_mentioned:
-            entity_type_str = classify_entity_name(name)
-            entity_type = EntityType(entity_type_str)
-            if self._register_entity(
-                name, entity_type,
-                finding.source, finding.language,
-            ):
+            key = KNOWN_TRANSLITERATIONS.get(name.lower(), name).lower()
+            entity = self.entities.get(key)
+            if entity is None:
+                self._register_entity(
+                    name, _ENTITY_TYPE_BY_VALUE[classify_entity_name(name)],
+                    finding.source, finding.language,
+                )
                 new_entities.append(name)
             else:
-                # Already known — increment mention count
-                key = KNOWN_TRANSLITERATIONS.get(
-                    name.lower(), name
-                ).lower()
-                if key in self.entities:
-                    self.entities[key].times_mentioned += 1
-                    self.entities[key].languages_seen_in.add(finding.language)
+                entity.times_mentioned += 1
+                entity.languages_seen_in.add(finding.language)
 
         # v3: Update weighted postulates (Phase 1)
         self._update_weighted_postulates(finding, finding.cycle)
 
         return new_entities
 
+    def ingest_findings(self, findings: list[Finding]) -> list[str]:
+        """Process a batch of findings in order.
+        Returns list of NEW entity names discovered across the batch.
+        """
+        new_entities: list[str] = []
+        for finding in findings:
+            new_entities.extend(self.ingest_finding(finding))
+        return new_entities
+
     def _register_entity(
         self,
         name: str,
@@ -187,7 +217,7 @@ class DynamicPostulates:
             self.entities[key].languages_seen_in.add(language)
             return False
 
-        self.entities[key] = Entity(
+        entity = Entity(
             name=canonical,
             entity_type=entity_type,
             first_seen_in=source,
@@ -196,6 +226,9 @@ class DynamicPostulates:
             languages_seen_in={language},
             affiliated_institution=institution,
         )
+        # Interned so entities and weighted_postulates share one key object
+        self.entities[sys.intern(key)] = entity
+        self._entities_by_name.setdefault(entity.name_lower.strip(), entity)
         return True
 
     def _update_weighted_postulates(
@@ -206,9 +239,7 @@ class DynamicPostulates:
         For each entity/theory/institution in the finding, find or create
         a WeightedPostulate and update its confidence score.
         """
-        decay_rate = DECAY_RATES.get(
-            self.discipline.lower(), DECAY_RATES["default"]
-        )
+        decay_rate = self._decay_rate
         subjects: list[tuple[str, str]] = []
 
         if finding.author:
@@ -226,7 +257,7 @@ class DynamicPostulates:
                 continue
 
             if key not in self.weighted_postulates:
-                self.weighted_postulates[key] = WeightedPostulate(
+                self.weighted_postulates[sys.intern(key)] = WeightedPostulate(
                     description=subject,
                     meta_axiom_id=axiom_id,
                     source_count=0,
@@ -241,11 +272,8 @@ class DynamicPostulates:
             wp.last_confirmed_cycle = cycle
 
             # Count distinct languages across all findings for this subject
-            langs = set()
-            for entity in self.entities.values():
-                if entity.name.lower().strip() == key:
-                    langs = entity.languages_seen_in
-                    break
+            entity = self._entities_by_name.get(key)
+            langs = entity.languages_seen_in if entity else set()
             langs.add(finding.language)
             wp.language_spread = len(langs)
 
@@ -344,7 +372,20 @@ class MultilingualQueryGenerator:
         self.postulates = postulates
 
     def generate_initial_queries(self) -> list[SearchQuery]:
-        """Generate seed queries in all relevant languages."""
+        """Generate seed queries in all relevant languages.
+
+        Seed queries depend only on (country, topic, discipline), so they
+        are built once per triple and copied out on each call.
+        """
+        templates = _initial_query_templates(
+            self.postulates.country,
+            self.postulates.topic,
+            self.postulates.discipline,
+        )
+        return [replace(q) for q in templates]
+
+    def _build_initial_queries(self) -> list[SearchQuery]:
+        """Build seed queries from the static language tables."""
         queries: list[SearchQuery] = []
         topic = self.postulates.topic
         country = self.postulates.country
@@ -422,81 +463,16 @@ class MultilingualQueryGenerator:
         """Generate targeted queries to fill detected gaps."""
         queries: list[SearchQuery] = []
         seen: set[tuple[str, str]] = set()
+        expanded: set[GapType] = set()
 
         for anomaly in anomalies:
             gap = anomaly.gap_type
-
-            if gap == GapType.ENTITY_UNRESEARCHED:
-                uninvestigated = self.postulates.get_uninvestigated_scholars()
-                top = sorted(
-                    uninvestigated, key=lambda e: -e.times_mentioned
-                )[:5]
-                for entity in top:
-                    for lang in self._relevant_languages():
-                        q = f"{entity.name} {self.postulates.topic} research"
-                        key = (q.lower(), lang)
-                        if key not in seen:
-                            seen.add(key)
-                            queries.append(SearchQuery(
-                                query=q,
-                                language=lang,
-                                rationale=f"Investigate {entity.name}",
-                                priority=Severity.HIGH,
-                                target_gap=GapType.ENTITY_UNRESEARCHED,
-                            ))
-
-            elif gap == GapType.LINGUISTIC:
-                covered = self.postulates.languages_covered
-                for lang in self._relevant_languages():
-                    if lang not in covered:
-                        translated = self._transliterate(
-                            self.postulates.topic, lang
-                        )
-                        q = f"{translated} research"
-                        key = (q.lower(), lang)
-                        if key not in seen:
-                            seen.add(key)
-                            queries.append(SearchQuery(
-                                query=q,
-                                language=lang,
-                                rationale=f"Fill language gap: {lang}",
-                                priority=Severity.HIGH,
-                                target_gap=GapType.LINGUISTIC,
-                            ))
-
-            elif gap == GapType.INSTITUTIONAL:
-                uninvestigated = (
-                    self.postulates.get_uninvestigated_institutions()
-                )
-                for inst in uninvestigated[:3]:
-                    q = f"{inst.name} {self.postulates.topic} publications"
-                    key = (q.lower(), "en")
-                    if key not in seen:
-                        seen.add(key)
-                        queries.append(SearchQuery(
-                            query=q,
-                            language="en",
-                            rationale=f"Investigate institution: {inst.name}",
-                            priority=Severity.MEDIUM,
-                            target_gap=GapType.INSTITUTIONAL,
-                        ))
-
-            elif gap == GapType.THEORY_UNSOURCED:
-                for theory in self.postulates.theories:
-                    q = (
-                        f'"{theory}" academic paper peer-reviewed '
-                        f"{self.postulates.topic}"
-                    )
-                    key = (q.lower(), "en")
-                    if key not in seen:
-                        seen.add(key)
-                        queries.append(SearchQuery(
-                            query=q,
-                            language="en",
-                            rationale=f"Find peer-reviewed source for: {theory}",
-                            priority=Severity.HIGH,
-                            target_gap=GapType.THEORY_UNSOURCED,
-                        ))
+            # Gap-type queries depend only on postulate state, so a second
+            # anomaly of the same type would only rebuild already-seen
+            # queries.
+            if gap not in expanded:
+                expanded.add(gap)
+                self._expand_gap(gap, seen, queries)
 
             # Use anomaly's own suggested queries
             for sq in anomaly.suggested_queries:
@@ -530,6 +506,86 @@ class MultilingualQueryGenerator:
 
         return queries
 
+    def _expand_gap(
+        self,
+        gap: GapType,
+        seen: set[tuple[str, str]],
+        queries: list[SearchQuery],
+    ) -> None:
+        """Append the gap-type queries for one gap, skipping seen keys."""
+        if gap == GapType.ENTITY_UNRESEARCHED:
+            uninvestigated = self.postulates.get_uninvestigated_scholars()
+            top = sorted(
+                uninvestigated, key=lambda e: -e.times_mentioned
+            )[:5]
+            langs = self._relevant_languages()
+            for entity in top:
+                for lang in langs:
+                    q = f"{entity.name} {self.postulates.topic} research"
+                    key = (q.lower(), lang)
+                    if key not in seen:
+                        seen.add(key)
+                        queries.append(SearchQuery(
+                            query=q,
+                            language=lang,
+                            rationale=f"Investigate {entity.name}",
+                            priority=Severity.HIGH,
+                            target_gap=GapType.ENTITY_UNRESEARCHED,
+                        ))
+
+        elif gap == GapType.LINGUISTIC:
+            covered = self.postulates.languages_covered
+            for lang in self._relevant_languages():
+                if lang not in covered:
+                    translated = self._transliterate(
+                        self.postulates.topic, lang
+                    )
+                    q = f"{translated} research"
+                    key = (q.lower(), lang)
+                    if key not in seen:
+                        seen.add(key)
+                        queries.append(SearchQuery(
+                            query=q,
+                            language=lang,
+                            rationale=f"Fill language gap: {lang}",
+                            priority=Severity.HIGH,
+                            target_gap=GapType.LINGUISTIC,
+                        ))
+
+        elif gap == GapType.INSTITUTIONAL:
+            uninvestigated = (
+                self.postulates.get_uninvestigated_institutions()
+            )
+            for inst in uninvestigated[:3]:
+                q = f"{inst.name} {self.postulates.topic} publications"
+                key = (q.lower(), "en")
+                if key not in seen:
+                    seen.add(key)
+                    queries.append(SearchQuery(
+                        query=q,
+                        language="en",
+                        rationale=f"Investigate institution: {inst.name}",
+                        priority=Severity.MEDIUM,
+                        target_gap=GapType.INSTITUTIONAL,
+                    ))
+
+        elif gap == GapType.THEORY_UNSOURCED:
+            for theory in self.postulates.theories:
+                q = (
+                    f'"{theory}" academic paper peer-reviewed '
+                    f"{self.postulates.topic}"
+                )
+                key = (q.lower(), "en")
+                if key not in seen:
+                    seen.add(key)
+                    queries.append(SearchQuery(
+                        query=q,
+                        language="en",
+                        rationale=f"Find peer-reviewed source for: {theory}",
+                        priority=Severity.HIGH,
+                        target_gap=GapType.THEORY_UNSOURCED,
+                    ))
+
     def generate_confidence_queries(self) -> list[SearchQuery]:
         """Generate queries driven by postulate confidence (Phase 1).
 
@@ -539,8 +595,10 @@ class MultilingualQueryGenerator:
         """
         queries: list[SearchQuery] = []
         seen: set[tuple[str, str]] = set()
+        # Non-English languages for deepening, computed on first need
+        deepen_langs: list[str] | None = None
 
-        for key, wp in self.postulates.weighted_postulates.items():
+        for wp in self.postulates.weighted_postulates.values():
             if wp.confidence < 0.3 and wp.source_count >= 1:
                 # VERIFY: try to confirm this postulate
                 q = (
@@ -563,26 +621,30 @@ class MultilingualQueryGenerator:
 
             elif wp.confidence > 0.8 and wp.language_spread < 2:
                 # DEEPEN: try other languages for well-known subjects
-                for lang in self._relevant_languages():
-                    if lang != "en":
-                        translated = self._transliterate(
-                            wp.description, lang
-                        )
-                        q = f"{translated} {self.postulates.topic}"
-                        qkey = (q.lower(), lang)
-                        if qkey not in seen:
-                            seen.add(qkey)
-                            queries.append(SearchQuery(
-                                query=q,
-                                language=lang,
-                                rationale=(
-                                    f"Deepen reliable postulate in {lang}: "
-                                    f"{wp.description}"
-                                ),
-                                priority=Severity.LOW,
-                                target_gap=GapType.LINGUISTIC,
-                            ))
-                            break  # one deepening query per postulate
+                if deepen_langs is None:
+                    deepen_langs = [
+                        lang for lang in self._relevant_languages()
+                        if lang != "en"
+                    ]
+                for lang in deepen_langs:
+                    translated = self._transliterate(
+                        wp.description, lang
+                    )
+                    q = f"{translated} {self.postulates.topic}"
+                    qkey = (q.lower(), lang)
+                    if qkey not in seen:
+                        seen.add(qkey)
+                        queries.append(SearchQuery(
+                            query=q,
+                            language=lang,
+                            rationale=(
+                                f"Deepen reliable postulate in {lang}: "
+                                f"{wp.description}"
+                            ),
+                            priority=Severity.LOW,
+                            target_gap=GapType.LINGUISTIC,
+                        ))
+                        break  # one deepening query per postulate
 
         return queries
 
@@ -596,8 +658,7 @@ class MultilingualQueryGenerator:
 
     def _extract_key_terms(self, topic: str) -> list[str]:
         """Extract searchable terms from a topic string."""
-        import re
-        words = re.split(r"[\s,;.\-/]+", topic)
+        words = _KEY_TERM_SPLIT_RE.split(topic)
         return [
             w for w in words
             if len(w) > 3 and w.lower() not in STOPWORDS
@@ -605,20 +666,34 @@ class MultilingualQueryGenerator:
 
     def _transliterate(self, term: str, language: str) -> str:
         """Translate a term to another language if possible."""
-        for name, translations in TRANSLITERATIONS.items():
-            if term.lower() == name.lower() and language in translations:
-                return translations[language]
+        lower = term.lower()
+        translations = _TRANSLITERATIONS_BY_NAME.get(lower)
+        if translations and language in translations:
+            return translations[language]
 
         geo = GEOGRAPHIC_LINGUISTIC.get(self.postulates.country, {})
         trans_map = geo.get("transliteration_map", {})
         if language in trans_map:
             for eng, local in trans_map[language].items():
-                if eng.lower() in term.lower():
-                    return term.lower().replace(eng.lower(), local)
+                if eng.lower() in lower:
+                    return lower.replace(eng.lower(), local)
 
         return term
 
 
+@functools.lru_cache(maxsize=64)
+def _initial_query_templates(
+    country: str, topic: str, discipline: str,
+) -> tuple[SearchQuery, ...]:
+    """Seed queries for one (country, topic, discipline).
+
+    Callers must copy before handing queries out: SearchQuery.executed
+    is set in place once a query runs.
+    """
+    postulates = DynamicPostulates(country, topic, discipline)
+    return tuple(MultilingualQueryGenerator(postulates)._build_initial_queries())
+
+
 # ============================================================
 # DYNAMIC INFERENCE ENGINE
 # ============================================================
@@ -665,6 +740,7 @@ class DynamicInferenceEngine:
                 gap_type=GapType.LINGUISTIC,
                 severity_if_unmet=Severity.HIGH,
                 derived_in_cycle=cycle,
+                language=lang,
             ))
 
         for lang, tradition in geo.get("foreign_traditions", {}).items():
@@ -673,6 +749,7 @@ class DynamicInferenceEngine:
                 gap_type=GapType.INSTITUTIONAL,
                 severity_if_unmet=Severity.MEDIUM,
                 derived_in_cycle=cycle,
+                language=lang,
             ))
 
         return expectations
@@ -811,6 +888,26 @@ class DynamicInferenceEngine:
 # EXPECTATION SATISFIER
 # ============================================================
 
+# Source types that count as peer-reviewed for theory sourcing
+_PEER_REVIEWED_TYPES: frozenset[str] = frozenset(
+    {"peer_reviewed", "peer-reviewed"}
+)
+
+# Cue word in a SOURCE_TYPE expectation → source types that satisfy it
+_SOURCE_TYPE_CUES: dict[str, frozenset[str]] = {
+    "peer-reviewed": _PEER_REVIEWED_TYPES,
+    "institutional": frozenset({"institutional", "government"}),
+    "journalistic": frozenset({"news", "journalistic", "media"}),
+}
+
+_AT_LEAST_RE = re.compile(r"at least (\d+)")
+
+
+def _long_words(text: str) -> set[str]:
+    """Words longer than four characters, used for theory matching."""
+    return {w for w in text.split() if len(w) > 4}
+
+
 class ExpectationSatisfier:
     """Checks which expectations are met by current findings."""
 
@@ -821,8 +918,6 @@ class ExpectationSatisfier:
         postulates: DynamicPostulates,
     ) -> None:
         """Mark expectations as satisfied based on findings."""
-        import re as _re
-
         langs = set(f.language for f in findings)
         types = set(f.source_type for f in findings)
         authors = set(f.author.lower() for f in findings if f.author)
@@ -833,10 +928,16 @@ class ExpectationSatisfier:
 
         theories_sourced: set[str] = set()
         for f in findings:
-            if f.theory_supported and f.source_type in (
-                "peer_reviewed", "peer-reviewed"
-            ):
+            if f.theory_supported and f.source_type in _PEER_REVIEWED_TYPES:
                 theories_sourced.add(f.theory_supported.lower())
+        # Long words of each sourced theory, matched against descriptions
+        theory_words = [
+            (theory, _long_words(theory)) for theory in theories_sourced
+        ]
+        # Only investigated entities can satisfy ENTITY_UNRESEARCHED
+        investigated = [
+            e for e in postulates.entities.values() if e.investigated
+        ]
 
         for exp in expectations:
             if exp.met:
@@ -845,17 +946,14 @@ class ExpectationSatisfier:
             desc_lower = exp.description.lower()
 
             if exp.gap_type == GapType.LINGUISTIC:
-                for lang in langs:
-                    if f"'{lang}'" in desc_lower:
-                        exp.satisfy(f"Found sources in {lang}")
-                        break
+                if exp.language and exp.language in langs:
+                    exp.satisfy(f"Found sources in {exp.language}")
 
             elif exp.gap_type == GapType.INSTITUTIONAL:
-                if "sources checked" in desc_lower:
-                    for lang in langs:
-                        if f"({lang})" in desc_lower:
-                            exp.satisfy(f"Sources found in {lang}")
-                            break
+                # Foreign-tradition expectations carry their language
+                if exp.language:
+                    if exp.language in langs:
+                        exp.satisfy(f"Sources found in {exp.language}")
                 elif "publications from" in desc_lower:
                     for inst in institutions:
                         if inst in desc_lower:
@@ -863,32 +961,22 @@ class ExpectationSatisfier:
                             break
 
             elif exp.gap_type == GapType.VOICE:
-                match = _re.search(r"at least (\d+)", desc_lower)
+                match = _AT_LEAST_RE.search(desc_lower)
                 if match:
                     minimum = int(match.group(1))
                     if len(authors) >= minimum:
                         exp.satisfy(f"{len(authors)} scholars found")
 
-            elif exp.gap_type == GapType.THEORY_UNSOURCED:
-                for theory in theories_sourced:
-                    theory_words = {
-                        w for w in theory.split() if len(w) > 4
-                    }
-                    desc_words = {
-                        w for w in desc_lower.split() if len(w) > 4
-                    }
-                    if theory_words & desc_words:
+            elif exp.gap_type == GapType.THEORY_UNSOURCED and theory_words:
+                desc_words = _long_words(desc_lower)
+                for theory, words in theory_words:
+                    if not words.isdisjoint(desc_words):
                         exp.satisfy(f"Peer-reviewed source: {theory}")
                         break
 
             elif exp.gap_type == GapType.SOURCE_TYPE:
-                source_type_map = {
-                    "peer-reviewed": {"peer_reviewed", "peer-reviewed"},
-                    "institutional": {"institutional", "government"},
-                    "journalistic": {"news", "journalistic", "media"},
-                }
-                for label, accepted in source_type_map.items():
-                    if label in desc_lower and types & accepted:
+                for label, accepted in _SOURCE_TYPE_CUES.items():
+                    if label in desc_lower and not accepted.isdisjoint(types):
                         exp.satisfy(f"Found {label} sources")
                         break
 
@@ -902,11 +990,8 @@ class ExpectationSatisfier:
                         exp.satisfy(f"Temporal span: {span} years")
 
             elif exp.gap_type == GapType.ENTITY_UNRESEARCHED:
-                for entity in postulates.entities.values():
-                    if (
-                        entity.name.lower() in desc_lower
-                        and entity.investigated
-                    ):
+                for entity in investigated:
+                    if entity.name_lower in desc_lower:
                         exp.satisfy(f"{entity.name} now investigated")
                         break
 
@@ -950,17 +1035,20 @@ class AuditEngine:
 
     def _check_unmet(self) -> None:
         """Create an anomaly for each unmet expectation."""
-        for exp in self.expectations:
-            if not exp.met:
-                rec = self._RECOMMENDATIONS.get(
+        recommendations = self._RECOMMENDATIONS
+        self.anomalies.extend([
+            Anomaly(
+                description=f"Unmet: {exp.description}",
+                gap_type=exp.gap_type,
+                severity=exp.severity_if_unmet,
+                recommendation=recommendations.get(
                     exp.gap_type.value, "Investigate further",
-                )
-                self.anomalies.append(Anomaly(
-                    description=f"Unmet: {exp.description}",
-                    gap_type=exp.gap_type,
-                    severity=exp.severity_if_unmet,
-                    recommendation=rec,
-                ))
+                ),
+                language=exp.language,
+            )
+            for exp in self.expectations
+            if not exp.met
+        ])
 
     def _check_monolingual(self) -> None:
         """Check if primary languages of the country are covered."""
@@ -978,6 +1066,7 @@ class AuditEngine:
                     gap_type=GapType.LINGUISTIC,
                     severity=Severity.HIGH,
                     recommendation=f"Search in {lang}",
+                    language=lang,
                 ))
 
     def _check_investigation_ratio(self) -> None:
@@ -1031,26 +1120,24 @@ def calculate_coverage(
             estimated_unreachable=0.0,
         )
 
-    # Partition expectations
-    barrier_exps = [
-        e for e in expectations if e.gap_type == GapType.ACCESS_BARRIER
-    ]
-    accessible_exps = [
-        e for e in expectations if e.gap_type != GapType.ACCESS_BARRIER
-    ]
-
-    # Accessible score (same formula as before)
+    # Partition expectations and accumulate the accessible score in one pass
+    barrier_exps: list[Expectation] = []
     weighted_total = 0.0
     weighted_met = 0.0
-    for exp in accessible_exps:
+    for exp in expectations:
+        if exp.gap_type == GapType.ACCESS_BARRIER:
+            barrier_exps.append(exp)
+            continue
         w = exp.severity_if_unmet.weight
         weighted_total += w
         if exp.met:
             weighted_met += w
 
     base = (weighted_met / weighted_total) * 100 if weighted_total > 0 else 0
-    penalty = sum(a.severity.weight * 0.5 for a in anomalies
-                  if a.gap_type != GapType.ACCESS_BARRIER)
+    penalty = 0.5 * sum(
+        a.severity.weight for a in anomalies
+        if a.gap_type != GapType.ACCESS_BARRIER
+    )
     penalty_norm = min(penalty, 30)
     accessible_score = max(base - penalty_norm, 0.0)
 
@@ -1058,11 +1145,16 @@ def calculate_coverage(
     barrier_annotations: list[str] = []
     total_gated = 0.0
     gated_met = sum(1 for e in barrier_exps if e.met)
+    # "(el," etc., as written into barrier descriptions by _access_barriers
+    ecosystem_tags = [
+        (f"({lang_code},", lang_code, eco)
+        for lang_code, eco in LANGUAGE_ECOSYSTEMS.items()
+    ] if barrier_exps else []
 
     for exp in barrier_exps:
         # Find the language code by checking which ecosystem matches
-        for lang_code, eco in LANGUAGE_ECOSYSTEMS.items():
-            if f"({lang_code}," in exp.description:
+        for tag, lang_code, eco in ecosystem_tags:
+            if tag in exp.description:
                 share = eco.estimated_gated_share * 100
                 total_gated += share
                 db_names = ", ".join(eco.gated_databases[:2])
@@ -1107,6 +1199,9 @@ class EpistemixEngine:
         self.postulates = DynamicPostulates(country, topic, discipline)
         self.query_gen = MultilingualQueryGenerator(self.postulates)
         self.findings: list[Finding] = []
+        # Same findings indexed by the cycle they were ingested in, so
+        # run_cycle() can pick this cycle's batch without rescanning.
+        self._findings_by_cycle: dict[int, list[Finding]] = {}
         self.all_expectations: list[Expectation] = []
         self.all_anomalies: list[Anomaly] = []
         self.pending_queries: list[SearchQuery] = []
@@ -1122,13 +1217,13 @@ class EpistemixEngine:
 
     def ingest_findings(self, new_findings: list[Finding]) -> list[str]:
         """Ingest findings. Returns list of new entity names."""
-        all_new: list[str] = []
         for f in new_findings:
             f.cycle = self.current_cycle
-            self.findings.append(f)
-            new_entities = self.postulates.ingest_finding(f)
-            all_new.extend(new_entities)
-        return all_new
+        self.findings.extend(new_findings)
+        self._findings_by_cycle.setdefault(
+            self.current_cycle, []
+        ).extend(new_findings)
+        return self.postulates.ingest_findings(new_findings)
 
     def run_cycle(self, connector=None) -> CycleSnapshot:
         """Run one complete audit cycle."""
@@ -1151,10 +1246,9 @@ class EpistemixEngine:
         # is current_cycle - 1 (set by ingest_findings before the increment).
         relations_count = 0
         if connector is not None:
-            cycle_for_findings = self.current_cycle - 1
-            new_findings = [
-                f for f in self.findings if f.cycle == cycle_for_findings
-            ]
+            new_findings = self._findings_by_cycle.get(
+                self.current_cycle - 1, []
+            )
             if new_findings:
                 new_relations = connector.extract_relations(new_findings)
                 for rel in new_relations:
@@ -1174,8 +1268,17 @@ class EpistemixEngine:
         self.pending_queries.extend(confidence_queries)
 
         # v3 Phase 7: apply temporal decay to all weighted postulates
+        # Postulates sharing a decay rate and confirmation cycle share a
+        # factor, so each distinct pair pays for one pow() only.
+        cycle = self.current_cycle
+        factors: dict[tuple[float, int], float] = {}
         for wp in self.postulates.weighted_postulates.values():
-            wp.confidence = wp.effective_confidence(self.current_cycle)
+            if cycle > wp.last_confirmed_cycle:
+                pair = (wp.decay_rate, wp.last_confirmed_cycle)
+                factor = factors.get(pair)
+                if factor is None:
+                    factor = factors[pair] = wp.decay_factor(cycle)
+                wp.confidence *= factor
 
         coverage_breakdown = calculate_coverage(
             self.all_expectations, self.all_anomalies
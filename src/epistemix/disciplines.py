@@ -36,7 +36,7 @@ class SubDiscipline:
 # DISCIPLINE TEMPLATES
 # ============================================================
 
-ARCHAEOLOGY_DISCIPLINES: list[SubDiscipline] = [
+ARCHAEOLOGY_DISCIPLINES: tuple[SubDiscipline, ...] = (
     SubDiscipline(
         name="Field archaeology",
         keywords=["excavation", "stratigraphy", "trench", "survey", "dig"],
@@ -99,10 +99,10 @@ ARCHAEOLOGY_DISCIPLINES: list[SubDiscipline] = [
         specialist_keywords=["ceramicist", "pottery specialist"],
         relevance_reason="Pottery is key dating evidence",
     ),
-]
+)
 
 
-def get_discipline_set(discipline: str) -> list[SubDiscipline]:
+def get_discipline_set(discipline: str) -> tuple[SubDiscipline, ...]:
     """Get the appropriate discipline template set."""
     discipline_lower = discipline.lower()
     if discipline_lower in ("archaeology", "archeology"):
@@ -126,10 +126,19 @@ class DisciplineAnalyzer:
 
     def __init__(self, discipline: str = "archaeology") -> None:
         self.disciplines = get_discipline_set(discipline)
+        # Every evidence and specialist keyword once, in template order
+        self._keywords: tuple[str, ...] = tuple(dict.fromkeys(
+            kw
+            for disc in self.disciplines
+            for kw in (*disc.keywords, *disc.specialist_keywords)
+        ))
         self.findings: list[Finding] = []
         self._corpus: str = ""
+        self._present: frozenset[str] = frozenset()
         self._relevant: dict[str, bool] = {}
         self._specialist_found: dict[str, bool] = {}
+        # (relevant, covered, missing) discipline names for the corpus
+        self._summary: tuple[tuple[str, ...], ...] | None = None
 
     def ingest_findings(self, findings: list[Finding]) -> None:
         """Build text corpus from findings."""
@@ -147,20 +156,25 @@ class DisciplineAnalyzer:
             for entity in f.entities_mentioned:
                 parts.append(entity.lower())
         self._corpus = " ".join(parts)
+        self._summary = None
         self._analyze()
 
     def _analyze(self) -> None:
         """Check relevance and specialist presence for each discipline."""
+        # One substring search per distinct keyword; everything after
+        # this reads the set instead of rescanning the corpus.
+        corpus = self._corpus
+        present = frozenset(kw for kw in self._keywords if kw in corpus)
+        self._present = present
         for disc in self.disciplines:
             # Check if evidence keywords are present
             self._relevant[disc.name] = (
-                disc.required
-                or any(kw in self._corpus for kw in disc.keywords)
+                disc.required or not present.isdisjoint(disc.keywords)
             )
 
             # Check if specialist keywords are present
-            self._specialist_found[disc.name] = any(
-                kw in self._corpus for kw in disc.specialist_keywords
+            self._specialist_found[disc.name] = not present.isdisjoint(
+                disc.specialist_keywords
             )
 
     def generate_expectations(self, cycle: int = 0) -> list[Expectation]:
@@ -198,7 +212,7 @@ class DisciplineAnalyzer:
             ):
                 # Count how many evidence keywords match
                 keyword_count = sum(
-                    1 for kw in disc.keywords if kw in self._corpus
+                    1 for kw in disc.keywords if kw in self._present
                 )
                 severity = (
                     Severity.CRITICAL if keyword_count >= 3 or disc.required
@@ -228,26 +242,32 @@ class DisciplineAnalyzer:
         return anomalies
 
     def coverage_summary(self) -> dict[str, Any]:
-        """Summary of disciplinary coverage."""
-        relevant = [
-            d.name for d in self.disciplines
-            if self._relevant.get(d.name, False)
-        ]
-        covered = [
-            d.name for d in self.disciplines
-            if self._relevant.get(d.name, False)
-            and self._specialist_found.get(d.name, False)
-        ]
-        missing = [
-            d.name for d in self.disciplines
-            if self._relevant.get(d.name, False)
-            and not self._specialist_found.get(d.name, False)
-        ]
+        """Summary of disciplinary coverage.
+
+        The classification is computed once per ingest; every call
+        returns a fresh dict, so callers may modify it.
+        """
+        if self._summary is None:
+            relevant: list[str] = []
+            covered: list[str] = []
+            missing: list[str] = []
+            for d in self.disciplines:
+                if not self._relevant.get(d.name, False):
+                    continue
+                relevant.append(d.name)
+                if self._specialist_found.get(d.name, False):
+                    covered.append(d.name)
+                else:
+                    missing.append(d.name)
+            self._summary = (tuple(relevant), tuple(covered), tuple(missing))
+
+        relevant_names, covered_names, missing_names = self._summary
         return {
-            "relevant_disciplines": relevant,
-            "covered": covered,
-            "missing": missing,
+            "relevant_disciplines": list(relevant_names),
+            "covered": list(covered_names),
+            "missing": list(missing_names),
             "coverage_ratio": (
-                len(covered) / len(relevant) if relevant else 0
+                len(covered_names) / len(relevant_names)
+                if relevant_names else 0
             ),
         }
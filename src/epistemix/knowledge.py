@@ -11,6 +11,8 @@ To improve entity classification: update the KNOWN_* sets.
 
 from __future__ import annotations
 
+import functools
+
 from epistemix.models import AccessTier, LanguageEcosystem
 
 
@@ -177,7 +179,7 @@ KNOWN_TRANSLITERATIONS: dict[str, str] = {
 # KNOWN ENTITY SETS (for entity classification heuristics)
 # ============================================================
 
-KNOWN_HISTORICAL_FIGURES: set[str] = {
+KNOWN_HISTORICAL_FIGURES: frozenset[str] = frozenset({
     "alexander", "alexander the great", "alexander iv",
     "hephaestion", "olympias", "cassander",
     "philip", "philip ii", "roxane", "nearchus",
@@ -185,23 +187,23 @@ KNOWN_HISTORICAL_FIGURES: set[str] = {
     "perdiccas", "ptolemy", "dinocrates", "deinokratis",
     "laomedon", "eurydice", "arrhidaeus",
     "amyntor",
-}
+})
 
-KNOWN_ANCIENT_SOURCES: set[str] = {
+KNOWN_ANCIENT_SOURCES: frozenset[str] = frozenset({
     "diodorus", "diodorus siculus", "plutarch", "arrian",
     "arrianus", "justin", "strabo", "pausanias",
-}
+})
 
-KNOWN_DEITIES_CONCEPTS: set[str] = {
+KNOWN_DEITIES_CONCEPTS: frozenset[str] = frozenset({
     "cybele", "persephone", "hades", "pluto", "hermes",
     "dionysus", "artemis", "demeter", "zeus",
-}
+})
 
-KNOWN_PLACES: set[str] = {
+KNOWN_PLACES: frozenset[str] = frozenset({
     "amphipolis", "vergina", "pella", "thessaloniki",
     "aigai", "athens", "dion", "babylon", "susa",
     "alexandria", "sidon", "anfipoli",
-}
+})
 
 
 # ============================================================
@@ -270,16 +272,27 @@ CROSS_LANGUAGE_STRATEGIES: dict[str, list[tuple[str, str]]] = {
 # QUERY GENERATION HELPERS
 # ============================================================
 
-STOPWORDS: set[str] = {
+STOPWORDS: frozenset[str] = frozenset({
     "the", "and", "for", "from", "with", "near", "about",
     "this", "that", "tomb", "della", "del", "von", "des",
-}
+})
+
+
+# Substrings that mark an entity name as an institution
+_INSTITUTION_KEYWORDS: tuple[str, ...] = (
+    "university", "museum", "institute", "ministry",
+    "school", "department", "laboratory", "centre", "center",
+    "archaeological service", "ephorate",
+)
 
 
+@functools.lru_cache(maxsize=4096)
 def classify_entity_name(name: str) -> str:
     """Classify an entity name using knowledge heuristics.
 
-    Returns an EntityType value string.
+    Returns an EntityType value string. Results are memoized: the
+    seed sets are frozen, so a name always classifies the same way,
+    and the same names recur across audits in one process.
     """
     lower = name.lower().strip()
 
@@ -300,12 +313,7 @@ def classify_entity_name(name: str) -> str:
             return "historical_figure"
 
     # Heuristic: institution keywords
-    institution_keywords = {
-        "university", "museum", "institute", "ministry",
-        "school", "department", "laboratory", "centre", "center",
-        "archaeological service", "ephorate",
-    }
-    for kw in institution_keywords:
+    for kw in _INSTITUTION_KEYWORDS:
         if kw in lower:
             return "institution"
 
@@ -10,6 +10,7 @@ imports from here.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -26,23 +27,23 @@ class Severity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    # Weights rise strictly with severity, so they double as the order
     def __lt__(self, other: Severity) -> bool:
-        order = {
-            Severity.LOW: 0, Severity.MEDIUM: 1,
-            Severity.HIGH: 2, Severity.CRITICAL: 3,
-        }
-        return order[self] < order[other]
+        return _SEVERITY_WEIGHTS[self] < _SEVERITY_WEIGHTS[other]
 
     def __le__(self, other: Severity) -> bool:
-        return self == other or self < other
+        return _SEVERITY_WEIGHTS[self] <= _SEVERITY_WEIGHTS[other]
 
     @property
     def weight(self) -> int:
         """Numeric weight for coverage calculations."""
-        return {
-            Severity.LOW: 1, Severity.MEDIUM: 2,
-            Severity.HIGH: 3, Severity.CRITICAL: 5,
-        }[self]
+        return _SEVERITY_WEIGHTS[self]
+
+
+_SEVERITY_WEIGHTS: dict[Severity, int] = {
+    Severity.LOW: 1, Severity.MEDIUM: 2,
+    Severity.HIGH: 3, Severity.CRITICAL: 5,
+}
 
 
 class GapType(Enum):
@@ -162,7 +163,7 @@ class CoverageBreakdown:
             "gated_expectations_met": self.gated_expectations_met,
         }
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """A tracked entity discovered during research.
 
@@ -176,14 +177,19 @@ class Entity:
     investigated: bool = False
     languages_seen_in: set = field(default_factory=set)
     affiliated_institution: str = ""
+    # Lowercased name, computed once; identity for hashing and equality
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = sys.intern(self.name.lower())
 
     def __hash__(self) -> int:
-        return hash(self.name.lower())
+        return hash(self.name_lower)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Entity):
             return NotImplemented
-        return self.name.lower() == other.name.lower()
+        return self.name_lower == other.name_lower
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -196,7 +202,7 @@ class Entity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Expectation:
     """A derived expectation about what knowledge should exist.
 
@@ -209,6 +215,7 @@ class Expectation:
     met: bool = False
     evidence: str = ""
     derived_in_cycle: int = 0
+    language: str = ""  # set when the expectation is about one language
 
     def satisfy(self, evidence: str) -> None:
         self.met = True
@@ -225,7 +232,7 @@ class Expectation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightedPostulate:
     """A postulate with confidence tracking and temporal decay.
 
@@ -256,10 +263,20 @@ class WeightedPostulate:
         cycles_per_month: float = 2.0,
     ) -> float:
         """Confidence with temporal decay applied."""
+        return self.confidence * self.decay_factor(
+            current_cycle, cycles_per_month
+        )
+
+    def decay_factor(
+        self,
+        current_cycle: int,
+        cycles_per_month: float = 2.0,
+    ) -> float:
+        """Multiplier applied to confidence after temporal decay."""
         if self.decay_rate == 0 or current_cycle <= self.last_confirmed_cycle:
-            return self.confidence
+            return 1.0
         months = (current_cycle - self.last_confirmed_cycle) / cycles_per_month
-        return self.confidence * ((1 - self.decay_rate) ** months)
+        return (1 - self.decay_rate) ** months
 
     @property
     def action(self) -> str:
@@ -285,7 +302,7 @@ class WeightedPostulate:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NegativePostulate:
     """Evidence of absence — a query that found nothing.
 
@@ -318,7 +335,7 @@ class NegativePostulate:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticRelation:
     """A typed relationship between two entities.
 
@@ -346,7 +363,7 @@ class SemanticRelation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A research finding from a search query.
 
@@ -393,7 +410,7 @@ class Finding:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     """A gap between expectation and reality.
 
@@ -406,6 +423,7 @@ class Anomaly:
     recommendation: str = ""
     suggested_queries: list = field(default_factory=list)
     detected_at_cycle: int = 0
+    language: str = ""  # set when the gap is specific to one language
 
     def __hash__(self) -> int:
         return hash((self.gap_type, self.description.lower().strip()))
@@ -426,10 +444,11 @@ class Anomaly:
             "recommendation": self.recommendation,
             "suggested_queries": self.suggested_queries,
             "detected_at_cycle": self.detected_at_cycle,
+            "language": self.language,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchQuery:
     """A search query to execute."""
     query: str
@@ -27,6 +27,11 @@ from epistemix.models import (
 from epistemix.core import DynamicPostulates
 from epistemix.knowledge import GEOGRAPHIC_LINGUISTIC
 
+# Substrings that mark a mentioned entity as an institution (Agent α)
+_INSTITUTION_CUES: tuple[str, ...] = (
+    "university", "museum", "ministry", "institute", "school",
+)
+
 
 # ============================================================
 # AGENT ALPHA — INSTITUTIONAL
@@ -68,8 +73,10 @@ class AgentInstitutional:
             if f.institution:
                 institutions.add(f.institution)
             for entity in f.entities_mentioned:
+                if entity in institutions:
+                    continue
                 lower = entity.lower()
-                for kw in ("university", "museum", "ministry", "institute", "school"):
+                for kw in _INSTITUTION_CUES:
                     if kw in lower:
                         institutions.add(entity)
                         break
@@ -88,12 +95,14 @@ class AgentInstitutional:
                 description=f"Sources in '{lang}' language found",
                 gap_type=GapType.LINGUISTIC,
                 severity_if_unmet=Severity.HIGH,
+                language=lang,
             ))
         for lang, tradition in geo.get("foreign_traditions", {}).items():
             expectations.append(Expectation(
                 description=f"Sources from {tradition} ({lang}) checked",
                 gap_type=GapType.INSTITUTIONAL,
                 severity_if_unmet=Severity.MEDIUM,
+                language=lang,
             ))
 
         # Diversity expectations
@@ -123,12 +132,8 @@ class AgentInstitutional:
             desc_lower = exp.description.lower()
 
             # Language match
-            for lang in langs:
-                if f"'{lang}'" in desc_lower:
-                    exp.satisfy(f"Found sources in {lang}")
-                    break
-
-            if exp.met:
+            if exp.gap_type == GapType.LINGUISTIC and exp.language in langs:
+                exp.satisfy(f"Found sources in {exp.language}")
                 continue
 
             # Institution match
@@ -30,6 +30,7 @@ def create_connector(args: argparse.Namespace) -> BaseConnector:
             api_key=api_key,
             model=args.model,
             max_budget=args.budget,
+            max_concurrency=args.concurrency,
         )
     return MockConnector()
 
@@ -163,6 +164,10 @@ def main() -> None:
         help="Claude model to use",
     )
     parser.add_argument("--api-key", help="Anthropic API key")
+    parser.add_argument(
+        "--concurrency", type=int, default=1,
+        help="Live queries in flight at once (default: 1)",
+    )
 
     args = parser.parse_args()
 
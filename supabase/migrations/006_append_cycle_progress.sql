@@ -0,0 +1,28 @@
+-- Per-cycle progress write used by the worker.
+-- Findings are append-only, so only the new ones are sent and appended
+-- in place; the rest of the progress columns are overwritten as before.
+-- One UPDATE keeps it to a single Realtime push per cycle.
+
+CREATE OR REPLACE FUNCTION public.record_cycle_progress(
+    p_audit_id UUID,
+    p_cycle INT,
+    p_coverage_history JSONB,
+    p_anomalies JSONB,
+    p_new_findings JSONB DEFAULT '[]'::jsonb
+)
+RETURNS void AS $$
+BEGIN
+    UPDATE public.audits
+    SET current_cycle = p_cycle,
+        coverage_history = p_coverage_history,
+        anomalies = p_anomalies,
+        findings = findings || p_new_findings
+    WHERE id = p_audit_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Worker only (service role); users must not be able to write progress
+REVOKE EXECUTE ON FUNCTION public.record_cycle_progress(UUID, INT, JSONB, JSONB, JSONB)
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.record_cycle_progress(UUID, INT, JSONB, JSONB, JSONB)
+    TO service_role;
@@ -0,0 +1,9 @@
+-- The engine also reports low-severity anomalies; accept them in the
+-- detailed table instead of failing the whole insert batch.
+
+ALTER TABLE public.audit_anomalies
+    DROP CONSTRAINT audit_anomalies_severity_check;
+
+ALTER TABLE public.audit_anomalies
+    ADD CONSTRAINT audit_anomalies_severity_check
+    CHECK (severity IN ('critical', 'high', 'medium', 'low'));
@@ -6,6 +6,13 @@ objects containing authors, institutions, theories, source types.
 
 from __future__ import annotations
 
+import json
+import re
+import sys
+import time
+from collections import namedtuple
+from types import MappingProxyType, ModuleType, SimpleNamespace
+
 import pytest
 
 from epistemix.models import (
@@ -26,23 +33,30 @@ from epistemix.models import (
 # AMPHIPOLIS FINDINGS — 4 cycles of rich simulation data
 # ============================================================
 
+# Read-only so no test can mutate the shared scenario definition.
+AMPHIPOLIS_SCENARIO = MappingProxyType({
+    "topic": "Amphipolis tomb excavation",
+    "country": "Greece",
+    "discipline": "archaeology",
+})
+
+
 @pytest.fixture
 def amphipolis_topic() -> str:
-    return "Amphipolis tomb excavation"
+    return AMPHIPOLIS_SCENARIO["topic"]
 
 
 @pytest.fixture
 def amphipolis_country() -> str:
-    return "Greece"
+    return AMPHIPOLIS_SCENARIO["country"]
 
 
 @pytest.fixture
 def amphipolis_discipline() -> str:
-    return "archaeology"
+    return AMPHIPOLIS_SCENARIO["discipline"]
 
 
-@pytest.fixture
-def cycle_0_findings() -> list[Finding]:
+def _cycle_0_findings() -> list[Finding]:
     """Initial cycle: key researchers and basic facts."""
     return [
         Finding(
@@ -108,8 +122,7 @@ def cycle_0_findings() -> list[Finding]:
     ]
 
 
-@pytest.fixture
-def cycle_1_findings() -> list[Finding]:
+def _cycle_1_findings() -> list[Finding]:
     """Second cycle: more theories and international coverage."""
     return [
         Finding(
@@ -160,8 +173,7 @@ def cycle_1_findings() -> list[Finding]:
     ]
 
 
-@pytest.fixture
-def cycle_2_findings() -> list[Finding]:
+def _cycle_2_findings() -> list[Finding]:
     """Third cycle: deeper investigation, more specialists."""
     return [
         Finding(
@@ -202,8 +214,7 @@ def cycle_2_findings() -> list[Finding]:
     ]
 
 
-@pytest.fixture
-def cycle_3_findings() -> list[Finding]:
+def _cycle_3_findings() -> list[Finding]:
     """Fourth cycle: final investigation of remaining gaps."""
     return [
         Finding(
@@ -233,14 +244,128 @@ def cycle_3_findings() -> list[Finding]:
 
 
 @pytest.fixture
-def all_findings(
-    cycle_0_findings, cycle_1_findings,
-    cycle_2_findings, cycle_3_findings,
-) -> list[Finding]:
-    """All findings from all 4 cycles."""
+def cycle_0_findings() -> list[Finding]:
+    return _cycle_0_findings()
+
+
+@pytest.fixture
+def cycle_1_findings() -> list[Finding]:
+    return _cycle_1_findings()
+
+
+@pytest.fixture
+def cycle_2_findings() -> list[Finding]:
+    return _cycle_2_findings()
+
+
+@pytest.fixture
+def cycle_3_findings() -> list[Finding]:
+    return _cycle_3_findings()
+
+
+AmphipolisView = namedtuple("AmphipolisView", [
+    "theories",
+    "entities_lower",
+    "languages",
+    "cycle_history",
+    "to_dict",
+    "weighted_postulates",
+    "report",
+])
+
+
+@pytest.fixture(scope="session")
+def amphipolis_view() -> AmphipolisView:
+    """Read-only snapshot of an engine after all 4 Amphipolis cycles.
+
+    The engine runs once per session; tests read the immutable view
+    instead of rebuilding (or copying) the engine themselves.
+    """
+    from epistemix.core import EpistemixEngine
+
+    engine = EpistemixEngine(
+        AMPHIPOLIS_SCENARIO["country"],
+        AMPHIPOLIS_SCENARIO["topic"],
+        AMPHIPOLIS_SCENARIO["discipline"],
+    )
+    engine.initialize()
+    for make_findings in (
+        _cycle_0_findings, _cycle_1_findings,
+        _cycle_2_findings, _cycle_3_findings,
+    ):
+        engine.ingest_findings(make_findings())
+        engine.run_cycle()
+
+    return AmphipolisView(
+        theories=tuple(engine.postulates.theories),
+        entities_lower=frozenset(engine.postulates.entities),
+        languages=frozenset(engine.postulates.languages_covered),
+        cycle_history=tuple(engine.cycle_history),
+        to_dict=MappingProxyType(engine.to_dict()),
+        weighted_postulates=MappingProxyType(
+            dict(engine.postulates.weighted_postulates)
+        ),
+        report=engine.report(),
+    )
+
+
+@pytest.fixture(scope="module")
+def amphipolis_postulates(all_findings) -> "DynamicPostulates":
+    """DynamicPostulates over all 4 Amphipolis cycles, built once per module.
+
+    The agents only read the postulates, so audit tests can share it;
+    tests that ingest their own findings should build their own.
+    """
+    from epistemix.core import DynamicPostulates
+
+    post = DynamicPostulates(
+        AMPHIPOLIS_SCENARIO["country"],
+        AMPHIPOLIS_SCENARIO["topic"],
+        AMPHIPOLIS_SCENARIO["discipline"],
+    )
+    post.ingest_findings(all_findings)
+    return post
+
+
+@pytest.fixture(scope="module")
+def amphipolis_agent_reports(
+    amphipolis_postulates, all_findings,
+) -> tuple["AgentReport", "AgentReport"]:
+    """Agent α and β reports over all 4 cycles, audited once per module.
+
+    Arbiter only reads the reports, so comparison tests can share them.
+    """
+    from epistemix.multi_agent import AgentInstitutional, AgentTheoretical
+
+    return (
+        AgentInstitutional(amphipolis_postulates).audit(all_findings),
+        AgentTheoretical(amphipolis_postulates).audit(all_findings),
+    )
+
+
+@pytest.fixture(scope="module")
+def amphipolis_discipline_analyzer(all_findings) -> "DisciplineAnalyzer":
+    """DisciplineAnalyzer over all 4 Amphipolis cycles, built once per module."""
+    from epistemix.disciplines import DisciplineAnalyzer
+
+    analyzer = DisciplineAnalyzer(AMPHIPOLIS_SCENARIO["discipline"])
+    analyzer.ingest_findings(all_findings)
+    return analyzer
+
+
+@pytest.fixture(scope="session")
+def all_findings() -> tuple[Finding, ...]:
+    """All findings from all 4 cycles, built once per session.
+
+    Shared across tests, so the container is a tuple; treat the
+    findings themselves as read-only too. It is built from the
+    cycle builders rather than the cycle_N fixtures because
+    EpistemixEngine.ingest_findings() rewrites Finding.cycle in place;
+    tests that feed an engine should take the per-test cycle_N fixtures.
+    """
     return (
-        cycle_0_findings + cycle_1_findings
-        + cycle_2_findings + cycle_3_findings
+        *_cycle_0_findings(), *_cycle_1_findings(),
+        *_cycle_2_findings(), *_cycle_3_findings(),
     )
 
 
@@ -431,3 +556,47 @@ def sars_connector() -> "MockConnector":
         "SARS-CoV-2\u6765\u6e90\u8c03\u67e5",
     ])
     return connector
+
+
+# ============================================================
+# FAKE ANTHROPIC SDK — for ClaudeConnector without network
+# ============================================================
+
+_SEARCH_FOR_RE = re.compile(r"Search for: (.*)")
+
+
+class _FakeMessages:
+    """Answers each search with one finding named after the query.
+
+    Queries whose text names a delay (e.g. "slow:0.05") sleep first, so
+    tests can force concurrent calls to finish out of order.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def create(self, **kwargs):
+        query = _SEARCH_FOR_RE.search(
+            kwargs["messages"][0]["content"]
+        ).group(1)
+        if query.startswith("slow:"):
+            time.sleep(float(query.split(":")[1].split()[0]))
+        self.calls.append(query)  # in completion order
+        text = json.dumps([{"source": query, "language": "en"}])
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=text)],
+            # $0.018 per call at the connector's per-token rates
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=1000),
+        )
+
+
+@pytest.fixture
+def fake_anthropic(monkeypatch) -> _FakeMessages:
+    """Install a stub anthropic package; returns its messages endpoint."""
+    messages = _FakeMessages()
+    stub = ModuleType("anthropic")
+    stub.Anthropic = lambda api_key=None: SimpleNamespace(messages=messages)
+    stub.RateLimitError = type("RateLimitError", (Exception,), {})
+    stub.APIStatusError = type("APIStatusError", (Exception,), {})
+    monkeypatch.setitem(sys.modules, "anthropic", stub)
+    return messages
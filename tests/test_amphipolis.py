@@ -6,17 +6,21 @@ Tests coverage progression, entity discovery, anomaly detection,
 and multi-agent divergence.
 """
 
-from epistemix.core import DynamicPostulates, EpistemixEngine
-from epistemix.disciplines import DisciplineAnalyzer
-from epistemix.multi_agent import (
-    AgentInstitutional,
-    AgentTheoretical,
-    Arbiter,
-    MultiAgentSystem,
-)
+import re
+from collections import Counter
+
+import pytest
+
+from epistemix.core import EpistemixEngine
 from epistemix.models import GapType
+from epistemix.multi_agent import MultiAgentSystem
+from epistemix.semantic_graph import SemanticGraph
+
+# Figures the cycle-0 theories must name; one pass over the joined text.
+_KEY_THEORY_FIGURES_RE = re.compile(r"\b(Hephaestion|Olympias)\b")
 
 
+@pytest.mark.slow
 class TestAmphipolisSimulation:
     """Tests using the Amphipolis reference scenario."""
 
@@ -27,9 +31,9 @@ class TestAmphipolisSimulation:
         new_entities = engine.ingest_findings(cycle_0_findings)
 
         # Should discover key figures
-        entity_names_lower = [e.lower() for e in new_entities]
-        assert any("peristeri" in n for n in entity_names_lower)
-        assert any("chugg" in n for n in entity_names_lower)
+        entity_names_lower = frozenset(e.lower() for e in new_entities)
+        assert "katerina peristeri" in entity_names_lower
+        assert "andrew chugg" in entity_names_lower
 
     def test_cycle_0_tracks_theories(self, cycle_0_findings):
         """First cycle should identify major theories."""
@@ -38,33 +42,28 @@ class TestAmphipolisSimulation:
         engine.ingest_findings(cycle_0_findings)
         engine.run_cycle()
 
-        theories = engine.postulates.theories
-        assert any("Hephaestion" in t for t in theories)
-        assert any("Olympias" in t for t in theories)
+        theories_text = "\n".join(engine.postulates.theories)
+        found = set(_KEY_THEORY_FIGURES_RE.findall(theories_text))
+        assert found == {"Hephaestion", "Olympias"}
 
-    def test_coverage_progression(
-        self, cycle_0_findings, cycle_1_findings,
-        cycle_2_findings, cycle_3_findings,
-    ):
+    def test_coverage_progression(self, amphipolis_view):
         """Coverage should improve across cycles."""
-        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
-        engine.initialize()
-
-        cycles = [
-            cycle_0_findings, cycle_1_findings,
-            cycle_2_findings, cycle_3_findings,
-        ]
-        for findings in cycles:
-            engine.ingest_findings(findings)
-            engine.run_cycle()
-
         # Should have 4 snapshots
-        assert len(engine.cycle_history) == 4
+        assert len(amphipolis_view.cycle_history) == 4
 
         # More expectations should be met over time
-        met_counts = [s.n_expectations_met for s in engine.cycle_history]
+        met_counts = [
+            s.n_expectations_met for s in amphipolis_view.cycle_history
+        ]
         assert met_counts[-1] >= met_counts[0]
 
+    def test_full_run_state(self, amphipolis_view):
+        """After all 4 cycles the engine state reflects every cycle."""
+        assert amphipolis_view.to_dict["cycle"] == 4
+        assert {"en", "el"} <= amphipolis_view.languages
+        assert "hephaestion" in amphipolis_view.entities_lower
+        assert len(amphipolis_view.theories) >= 2
+
     def test_multilingual_coverage(
         self, cycle_0_findings, cycle_1_findings,
     ):
@@ -90,15 +89,11 @@ class TestAmphipolisSimulation:
         # Check if Mavrogiannis's mentions of "Anfipoli" are normalized
         entities = engine.postulates.entities
         # "Efestione" mentioned in cycle_1 should normalize
-        assert "hephaestion" in entities or any(
-            "hephaestion" in k for k in entities
-        )
+        assert "hephaestion" in entities
 
-    def test_discipline_gap_detection(self, all_findings):
+    def test_discipline_gap_detection(self, amphipolis_discipline_analyzer):
         """Should detect missing specialist disciplines."""
-        analyzer = DisciplineAnalyzer("archaeology")
-        analyzer.ingest_findings(all_findings)
-        anomalies = analyzer.generate_anomalies()
+        anomalies = amphipolis_discipline_analyzer.generate_anomalies()
 
         # With our data, some disciplines should be missing
         gap_types = [a.gap_type for a in anomalies]
@@ -106,8 +101,6 @@ class TestAmphipolisSimulation:
 
     def test_semantic_graph_structure(self, amphipolis_relations):
         """Semantic graph should reflect the research network."""
-        from epistemix.semantic_graph import SemanticGraph
-
         graph = SemanticGraph()
         graph.add_relations(amphipolis_relations)
 
@@ -140,66 +133,47 @@ class TestAmphipolisSimulation:
         assert isinstance(d["coverage_percentage"], float)
 
 
+@pytest.mark.slow
 class TestAmphipolisMultiAgent:
     """Multi-agent tests with Amphipolis data."""
 
-    def test_dual_agent_produces_results(self, all_findings):
+    def test_dual_agent_produces_results(self, amphipolis_agent_reports):
         """Both agents should produce meaningful reports."""
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
+        report_a, report_b = amphipolis_agent_reports
 
         assert len(report_a.expectations) > 0
         assert len(report_b.expectations) > 0
         assert report_a.coverage_score >= 0
         assert report_b.coverage_score >= 0
 
-    def test_agents_find_different_anomalies(self, all_findings):
+    def test_agents_find_different_anomalies(self, amphipolis_agent_reports):
         """Agents with different focuses should find different issues."""
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
+        report_a, report_b = amphipolis_agent_reports
 
         # They should have different gap types in their anomalies
-        alpha_types = {a.gap_type for a in report_a.anomalies}
-        beta_types = {a.gap_type for a in report_b.anomalies}
+        alpha_types = Counter(a.gap_type for a in report_a.anomalies)
+        beta_types = Counter(a.gap_type for a in report_b.anomalies)
         # At least one type should differ
-        assert alpha_types != beta_types or (
-            len(report_a.anomalies) == 0 and len(report_b.anomalies) == 0
+        assert alpha_types.keys() != beta_types.keys() or (
+            not alpha_types and not beta_types
         )
 
-    def test_arbiter_finds_known_unknowns(self, all_findings):
+    def test_arbiter_finds_known_unknowns(
+        self, amphipolis_postulates, all_findings
+    ):
         """Arbiter should identify discrepancies between agents."""
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        system = MultiAgentSystem(post)
+        system = MultiAgentSystem(amphipolis_postulates)
         result = system.run(all_findings)
 
         assert "combined" in result
         assert "known_unknowns" in result["combined"]
         assert result["combined"]["total_anomalies"] >= 0
 
-    def test_multi_agent_serialization(self, all_findings):
+    def test_multi_agent_serialization(
+        self, amphipolis_postulates, all_findings
+    ):
         """Multi-agent result should serialize for database."""
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        system = MultiAgentSystem(post)
+        system = MultiAgentSystem(amphipolis_postulates)
         result = system.run(all_findings)
 
         # Check structure matches what worker writes to DB
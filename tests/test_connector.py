@@ -1,6 +1,11 @@
 """Tests for the connector module."""
 
-from epistemix.connector import MockConnector, extract_json
+from types import MappingProxyType
+
+import pytest
+
+import epistemix.connector
+from epistemix.connector import ClaudeConnector, MockConnector, extract_json
 from epistemix.models import Finding, GapType, RelationType, SearchQuery, SemanticRelation, Severity
 
 
@@ -34,6 +39,97 @@ class TestMockConnector:
         findings = connector.execute_query(query)
         assert len(findings) == 1
 
+    def test_register_findings_map_accepts_read_only_mapping(self):
+        findings = [Finding(source="Paper", language="en")]
+        table = MappingProxyType({"Amphipolis": findings, "tomb": []})
+        connector = MockConnector()
+        connector.register_findings_map(table)
+        query = SearchQuery(query="amphipolis research", language="en")
+        assert connector.execute_query(query) is findings
+
+    def test_casefold_matching(self):
+        connector = MockConnector()
+        connector.register_findings("Straße", [
+            Finding(source="Paper", language="de"),
+        ])
+        query = SearchQuery(query="STRASSE archaeology", language="de")
+        findings = connector.execute_query(query)
+        assert len(findings) == 1
+
+    def test_first_registered_pattern_wins(self):
+        connector = MockConnector()
+        connector.register_findings("tomb", [
+            Finding(source="Tomb paper", language="en"),
+        ])
+        connector.register_findings("amphipolis", [
+            Finding(source="Site paper", language="en"),
+        ])
+        # "amphipolis" occurs earlier in the text, but "tomb" was registered first
+        query = SearchQuery(query="amphipolis tomb", language="en")
+        findings = connector.execute_query(query)
+        assert findings[0].source == "Tomb paper"
+
+    def test_large_registry_keeps_first_registered_priority(self):
+        connector = MockConnector()
+        for i in range(100):
+            connector.register_findings(f"topic {i:03d}", [
+                Finding(source=f"P{i}", language="en"),
+            ])
+        connector.register_findings("tomb", [
+            Finding(source="Tomb", language="en"),
+        ])
+        query = SearchQuery(query="tomb of topic 042", language="en")
+        findings = connector.execute_query(query)
+        assert findings[0].source == "P42"
+        miss = SearchQuery(query="nothing here", language="en")
+        assert connector.execute_query(miss) == []
+
+    def test_regex_scan_agrees_with_substring_scan(self, monkeypatch):
+        # Overlapping, nested and re-registered patterns, past the
+        # substring-scan cutoff, so both match paths see the same registry.
+        patterns = [f"site {i}" for i in range(36)] + [
+            "tomb", "amphipolis tomb", "is t", "site 1", "Straße", "site 3",
+        ]
+        connector = MockConnector()
+        for i, pattern in enumerate(patterns):
+            connector.register_findings(pattern, [
+                Finding(source=f"P{i}", language="en"),
+            ])
+        texts = [
+            "amphipolis tomb", "site 12 and site 3", "site 35 tomb",
+            "this tomb", "STRASSE site 2", "nothing here", "site 1",
+        ]
+
+        def sources(scan_max: int) -> list[list[str]]:
+            monkeypatch.setattr(
+                epistemix.connector, "_SUBSTRING_SCAN_MAX", scan_max,
+            )
+            return [
+                [f.source for f in connector.execute_query(
+                    SearchQuery(query=text, language="en"),
+                )]
+                for text in texts
+            ]
+
+        assert len(patterns) > epistemix.connector._SUBSTRING_SCAN_MAX
+        assert sources(0) == sources(len(patterns))
+
+    def test_register_after_query(self):
+        connector = MockConnector()
+        connector.register_findings("alpha", [
+            Finding(source="A", language="en"),
+        ])
+        assert connector.execute_query(
+            SearchQuery(query="beta", language="en")
+        ) == []
+        connector.register_findings("beta", [
+            Finding(source="B", language="en"),
+        ])
+        findings = connector.execute_query(
+            SearchQuery(query="beta", language="en")
+        )
+        assert findings[0].source == "B"
+
     def test_execute_batch(self):
         connector = MockConnector()
         connector.register_findings("topic", [
@@ -137,3 +233,48 @@ class TestMockConnectorLocalizedQueries:
             "archaeology", "zh", "archaeology",
         )
         assert queries == []
+
+
+class TestClaudeConnectorBatch:
+    def test_concurrent_results_keep_priority_order(self, fake_anthropic):
+        connector = ClaudeConnector(api_key="test", max_concurrency=4)
+        # The critical query finishes last; its findings still come first.
+        queries = [
+            SearchQuery(query="low", language="en", priority=Severity.LOW),
+            SearchQuery(
+                query="slow:0.05 critical", language="en",
+                priority=Severity.CRITICAL,
+            ),
+            SearchQuery(query="medium", language="en", priority=Severity.MEDIUM),
+            SearchQuery(query="high", language="en", priority=Severity.HIGH),
+        ]
+        findings = connector.execute_batch(queries)
+        assert [f.source for f in findings] == [
+            "slow:0.05 critical", "high", "medium", "low",
+        ]
+        assert fake_anthropic.calls[-1] == "slow:0.05 critical"
+        assert all(q.executed for q in queries)
+
+    def test_budget_checked_before_each_window(self, fake_anthropic):
+        # Each fake call costs $0.018: the first window of two spends
+        # $0.036, over budget, so no later window starts.
+        connector = ClaudeConnector(
+            api_key="test", max_budget=0.03, max_concurrency=2,
+        )
+        queries = [
+            SearchQuery(query=f"q{i}", language="en") for i in range(5)
+        ]
+        findings = connector.execute_batch(queries)
+        assert len(fake_anthropic.calls) == 2
+        assert [f.source for f in findings] == ["q0", "q1"]
+        assert connector.total_cost == pytest.approx(0.036)
+
+    def test_sequential_by_default(self, fake_anthropic):
+        connector = ClaudeConnector(api_key="test", max_budget=0.03)
+        queries = [
+            SearchQuery(query=f"q{i}", language="en") for i in range(5)
+        ]
+        findings = connector.execute_batch(queries)
+        # Budget is checked before every query: the second call tips it.
+        assert [f.source for f in findings] == ["q0", "q1"]
+
@@ -1,5 +1,7 @@
 """Tests for content analysis module."""
 
+import pytest
+
 from epistemix.content_analysis import (
     ContentAnalysisEngine,
     ConvergenceAnalyzer,
@@ -47,6 +49,29 @@ class TestStructuralAbsenceDetector:
         anomalies = detector.generate_anomalies()
         assert anomalies[0].severity.value == "critical"
 
+    def test_addressing_is_case_insensitive(self):
+        fact = StructuralFact(
+            description="Tomb contents",
+            items=["Skeleton", "coins", "Lion statue"],
+            addressed_by={"Theory A": ["COINS"]},
+        )
+        fact.register_addressing("Theory B", ["skeleton", "unrelated"])
+        assert fact.unaddressed_items == ["Lion statue"]
+        assert fact.unaddressed_mask.bit_count() == 1
+
+    def test_fields_are_read_only(self):
+        fact = StructuralFact(
+            description="Tomb contents",
+            items=["skeleton", "coins"],
+            addressed_by={"Theory A": ["coins"]},
+        )
+        fact.register_addressing("Theory A", ["skeleton"])
+        assert fact.items == ("skeleton", "coins")
+        assert fact.addressed_by == {"Theory A": ("coins", "skeleton")}
+        with pytest.raises(TypeError):
+            fact.addressed_by["Theory B"] = ("coins",)
+        assert fact.unaddressed_items == []
+
 
 class TestConvergenceAnalyzer:
     def test_high_convergence(self):
@@ -87,8 +112,41 @@ class TestConvergenceAnalyzer:
         analyzer = ConvergenceAnalyzer()
         assert analyzer.uniformity_score() == 0.0
 
+    def test_positions_are_read_only(self):
+        analyzer = ConvergenceAnalyzer()
+        position = TheoryPosition(question="Q", theory="A", answer="X")
+        analyzer.register_position(position)
+        assert analyzer.positions == (position,)
+        with pytest.raises(AttributeError):
+            analyzer.positions.append(position)
+
+    def test_isolated_advocate(self):
+        analyzer = ConvergenceAnalyzer()
+        for theory in ("A", "B"):
+            analyzer.register_position(TheoryPosition(
+                question="Who is buried?", theory=theory, answer="Olympias",
+            ))
+        analyzer.register_position(TheoryPosition(
+            question="Who is buried?", theory="C", answer="Hephaestion",
+        ))
+        voices = [
+            a for a in analyzer.generate_anomalies()
+            if a.gap_type == GapType.VOICE
+        ]
+        assert len(voices) == 1
+        assert "'C'" in voices[0].description
+        assert "hephaestion" in voices[0].description
+
 
 class TestEmptyQueryAnalyzer:
+    def test_results_are_read_only(self):
+        analyzer = EmptyQueryAnalyzer()
+        result = QueryResult(query="q", language="el", empty=True)
+        analyzer.register_result(result)
+        assert analyzer.results == (result,)
+        with pytest.raises(AttributeError):
+            analyzer.results.append(result)
+
     def test_language_gap_detection(self):
         analyzer = EmptyQueryAnalyzer()
         # Greek: 3 queries, all empty
@@ -103,11 +161,9 @@ class TestEmptyQueryAnalyzer:
                 findings_count=3, empty=False,
             ))
         anomalies = analyzer.generate_anomalies()
-        el_anomalies = [
-            a for a in anomalies
-            if "'el'" in a.description
-        ]
+        el_anomalies = [a for a in anomalies if a.language == "el"]
         assert len(el_anomalies) >= 1
+        assert "'el'" in el_anomalies[0].description
 
     def test_no_anomaly_when_productive(self):
         analyzer = EmptyQueryAnalyzer()
@@ -218,6 +274,26 @@ class TestContentAnalysisEngine:
         anomalies = engine.generate_all_anomalies()
         assert len(anomalies) >= 2  # structural + convergence
 
+    def test_facade_reuses_anomalies_until_new_data(self):
+        engine = ContentAnalysisEngine()
+        fact = StructuralFact(description="Test", items=["a", "b"])
+        engine.structural.register_fact(fact)
+        first = engine.generate_all_anomalies()
+        second = engine.generate_all_anomalies()
+        assert first == second
+        assert first[0] is second[0]
+
+        # Addressing an already-registered fact invalidates the cache
+        fact.register_addressing("Theory A", ["a", "b"])
+        assert engine.generate_all_anomalies() == []
+
+        for i in range(3):
+            engine.empty_queries.register_result(QueryResult(
+                query=f"q{i}", language="de", empty=True,
+            ))
+        gap_types = {a.gap_type for a in engine.generate_all_anomalies()}
+        assert GapType.EMPTY_QUERY_PATTERN in gap_types
+
     def test_facade_generates_negative_postulates(self):
         """ContentAnalysisEngine facade should delegate to EmptyQueryAnalyzer."""
         engine = ContentAnalysisEngine()
@@ -60,7 +60,7 @@ class TestDynamicPostulates:
         )
         post.ingest_finding(f1)
         post.ingest_finding(f2)
-        assert post.entities["bob"].times_mentioned >= 2
+        assert post.entities["bob"].times_mentioned == 2
 
     def test_transliteration_normalization(self):
         post = DynamicPostulates("Greece", "test")
@@ -72,6 +72,23 @@ class TestDynamicPostulates:
         # "Efestione" should normalize to "hephaestion"
         assert "hephaestion" in post.entities
 
+    def test_ingest_findings_batch(self):
+        post = DynamicPostulates("Greece", "test")
+        findings = [
+            Finding(
+                source="Paper1", language="en",
+                author="Alice", entities_mentioned=["Bob"],
+            ),
+            Finding(
+                source="Paper2", language="fr",
+                author="Carol", entities_mentioned=["Bob"],
+            ),
+        ]
+        new = post.ingest_findings(findings)
+        assert new == ["Alice", "Bob", "Carol"]
+        assert post.entities["bob"].times_mentioned == 2
+        assert post.languages_covered == {"en", "fr"}
+
     def test_get_uninvestigated_scholars(self):
         post = DynamicPostulates("Greece", "test")
         f = Finding(
@@ -106,6 +123,23 @@ class TestMultilingualQueryGenerator:
         # Greece has Greek + foreign traditions
         assert len(queries) >= 3
 
+    def test_initial_queries_are_fresh_copies(self):
+        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
+        gen = MultilingualQueryGenerator(post)
+        first = gen.generate_initial_queries()
+        first[0].executed = True
+        second = gen.generate_initial_queries()
+        assert [q.query for q in second] == [q.query for q in first]
+        assert not any(q.executed for q in second)
+
+    def test_transliterate_known_names_and_terms(self):
+        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
+        gen = MultilingualQueryGenerator(post)
+        assert gen._transliterate("HEPHAESTION", "it") == "Efestione"
+        assert gen._transliterate("Hephaestion", "xx") == "Hephaestion"
+        assert gen._transliterate("Tomb", "el") == "\u03c4\u03ac\u03c6\u03bf\u03c2"
+        assert gen._transliterate("Kasta", "ja") == "Kasta"
+
     def test_gap_filling_queries(self):
         from epistemix.models import Anomaly
         post = DynamicPostulates("Greece", "test")
@@ -158,6 +192,7 @@ class TestExpectationSatisfier:
                 description="Sources in 'en' language found",
                 gap_type=GapType.LINGUISTIC,
                 severity_if_unmet=Severity.HIGH,
+                language="en",
             )
         ]
         findings = [Finding(source="Paper", language="en")]
@@ -198,6 +233,16 @@ class TestAuditEngine:
             a.gap_type == GapType.LINGUISTIC for a in anomalies
         )
 
+    def test_language_gaps_carry_their_language(self):
+        post = DynamicPostulates("Greece", "test")
+        expectations = DynamicInferenceEngine(post).derive(cycle=1)
+        anomalies = AuditEngine(expectations, [], post).run()
+        linguistic = [a for a in anomalies if a.gap_type == GapType.LINGUISTIC]
+        assert linguistic
+        assert all(a.language for a in linguistic)
+        assert "el" in {a.language for a in linguistic}
+        assert linguistic[0].to_dict()["language"] == linguistic[0].language
+
 
 class TestCalculateCoverage:
     def test_all_met(self):
@@ -339,6 +384,19 @@ class TestWeightedPostulates:
         assert conf_multilingual > conf_en_only
         assert post.weighted_postulates["peristeri"].language_spread == 2
 
+    def test_language_spread_uses_mentioned_entity(self):
+        post = DynamicPostulates("Greece", "test", "archaeology")
+        post.ingest_finding(Finding(
+            source="P1", language="de", author="Alice",
+            entities_mentioned=["Bob"],
+        ))
+        post.ingest_finding(Finding(
+            source="P2", language="fr", author="Carol",
+            entities_mentioned=["Bob"],
+        ))
+        post.ingest_finding(Finding(source="P3", language="el", author="Bob"))
+        assert post.weighted_postulates["bob"].language_spread == 3
+
     def test_decay_rate_from_discipline(self):
         """Decay rate should match the discipline."""
         post = DynamicPostulates("Greece", "test", "archaeology")
@@ -8,6 +8,20 @@ from epistemix.disciplines import (
 from epistemix.models import Finding, GapType
 
 
+def _analyzed(
+    source: str, entities: list[str], author: str = "",
+) -> DisciplineAnalyzer:
+    """Archaeology analyzer that has ingested one English finding."""
+    analyzer = DisciplineAnalyzer("archaeology")
+    analyzer.ingest_findings([
+        Finding(
+            source=source, language="en", author=author,
+            entities_mentioned=entities,
+        ),
+    ])
+    return analyzer
+
+
 class TestDisciplineTemplates:
     def test_archaeology_has_disciplines(self):
         assert len(ARCHAEOLOGY_DISCIPLINES) >= 8
@@ -23,30 +37,17 @@ class TestDisciplineTemplates:
 
 class TestDisciplineAnalyzer:
     def test_detects_relevant_disciplines(self):
-        analyzer = DisciplineAnalyzer("archaeology")
-        findings = [
-            Finding(
-                source="Inscription study",
-                language="en",
-                author="Alice",
-                entities_mentioned=["inscription", "monogram"],
-            ),
-        ]
-        analyzer.ingest_findings(findings)
+        analyzer = _analyzed(
+            "Inscription study", ["inscription", "monogram"], author="Alice",
+        )
         summary = analyzer.coverage_summary()
         assert "Epigraphy" in summary["relevant_disciplines"]
 
     def test_detects_missing_specialist(self):
-        analyzer = DisciplineAnalyzer("archaeology")
-        findings = [
-            Finding(
-                source="Bone analysis",
-                language="en",
-                author="Alice",
-                entities_mentioned=["skeleton", "burial", "human remains"],
-            ),
-        ]
-        analyzer.ingest_findings(findings)
+        analyzer = _analyzed(
+            "Bone analysis", ["skeleton", "burial", "human remains"],
+            author="Alice",
+        )
         anomalies = analyzer.generate_anomalies()
         disc_anomalies = [
             a for a in anomalies if a.gap_type == GapType.DISCIPLINE_GAP
@@ -59,16 +60,10 @@ class TestDisciplineAnalyzer:
         assert len(osteology) >= 1
 
     def test_specialist_found_no_anomaly(self):
-        analyzer = DisciplineAnalyzer("archaeology")
-        findings = [
-            Finding(
-                source="DNA study by geneticist",
-                language="en",
-                author="geneticist Smith",
-                entities_mentioned=["dna", "ancient dna", "geneticist"],
-            ),
-        ]
-        analyzer.ingest_findings(findings)
+        analyzer = _analyzed(
+            "DNA study by geneticist", ["dna", "ancient dna", "geneticist"],
+            author="geneticist Smith",
+        )
         anomalies = analyzer.generate_anomalies()
         dna_anomalies = [
             a for a in anomalies if "DNA" in a.description
@@ -76,32 +71,56 @@ class TestDisciplineAnalyzer:
         assert len(dna_anomalies) == 0
 
     def test_generate_expectations(self):
-        analyzer = DisciplineAnalyzer("archaeology")
-        findings = [
-            Finding(
-                source="Excavation report",
-                language="en",
-                author="Alice",
-                entities_mentioned=["excavation", "stratigraphy"],
-            ),
-        ]
-        analyzer.ingest_findings(findings)
+        analyzer = _analyzed(
+            "Excavation report", ["excavation", "stratigraphy"],
+            author="Alice",
+        )
         expectations = analyzer.generate_expectations(cycle=1)
         assert len(expectations) >= 1
 
     def test_coverage_summary(self):
-        analyzer = DisciplineAnalyzer("archaeology")
-        findings = [
-            Finding(
-                source="Test archaeologist report",
-                language="en",
-                author="archaeologist Jones",
-                entities_mentioned=[
-                    "excavation", "archaeologist",
-                ],
-            ),
-        ]
-        analyzer.ingest_findings(findings)
+        analyzer = _analyzed(
+            "Test archaeologist report", ["excavation", "archaeologist"],
+            author="archaeologist Jones",
+        )
         summary = analyzer.coverage_summary()
         assert "coverage_ratio" in summary
         assert isinstance(summary["coverage_ratio"], float)
+
+    def test_anomalies_follow_next_ingest(self):
+        analyzer = _analyzed("Bone analysis", ["skeleton", "burial"])
+        first = analyzer.generate_anomalies()
+        assert any("Osteology" in a.description for a in first)
+
+        analyzer.ingest_findings([
+            Finding(
+                source="Osteologist report",
+                language="en",
+                author="osteologist Jones",
+                entities_mentioned=["skeleton", "osteologist"],
+            ),
+        ])
+        assert not any(
+            "Osteology" in a.description
+            for a in analyzer.generate_anomalies()
+        )
+
+    def test_coverage_summary_cached_until_next_ingest(self):
+        analyzer = _analyzed("Bone analysis", ["skeleton", "burial"])
+        first = analyzer.coverage_summary()
+        assert "Osteology" in first["missing"]
+
+        # Each call hands out its own copy of the cached classification
+        first["missing"].clear()
+        assert "Osteology" in analyzer.coverage_summary()["missing"]
+
+        analyzer.ingest_findings([
+            Finding(
+                source="Osteologist report",
+                language="en",
+                entities_mentioned=["skeleton", "osteologist"],
+            ),
+        ])
+        second = analyzer.coverage_summary()
+        assert "Osteology" in second["covered"]
+        assert "Osteology" not in second["missing"]
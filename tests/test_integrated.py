@@ -3,7 +3,6 @@
 from epistemix.connector import MockConnector
 from epistemix.core import EpistemixEngine
 from epistemix.content_analysis import ContentAnalysisEngine
-from epistemix.disciplines import DisciplineAnalyzer
 from epistemix.multi_agent import MultiAgentSystem
 from epistemix.models import Finding, RelationType, SemanticRelation
 
@@ -28,23 +27,14 @@ class TestFullPipeline:
         assert snap2.cycle == 2
         assert snap2.n_findings > snap1.n_findings
 
-    def test_coverage_increases_with_more_data(
-        self, cycle_0_findings, cycle_1_findings
-    ):
+    def test_coverage_increases_with_more_data(self, amphipolis_view):
         """Coverage should generally improve with more diverse findings."""
-        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
-        engine.initialize()
-
-        engine.ingest_findings(cycle_0_findings)
-        snap1 = engine.run_cycle()
-
-        engine.ingest_findings(cycle_1_findings)
-        snap2 = engine.run_cycle()
+        snap1, snap2 = amphipolis_view.cycle_history[:2]
 
         # More data = more expectations met
         assert snap2.n_expectations_met >= snap1.n_expectations_met
 
-    def test_auxiliary_analyses(self, all_findings):
+    def test_auxiliary_analyses(self, amphipolis_discipline_analyzer):
         """Semantic graph, disciplines, content analysis all work."""
         # Semantic graph (replaces citation graph)
         from epistemix.semantic_graph import SemanticGraph
@@ -52,9 +42,7 @@ class TestFullPipeline:
         assert graph.summary()["total_nodes"] == 0  # empty until relations added
 
         # Disciplines
-        analyzer = DisciplineAnalyzer("archaeology")
-        analyzer.ingest_findings(all_findings)
-        disc_summary = analyzer.coverage_summary()
+        disc_summary = amphipolis_discipline_analyzer.coverage_summary()
         assert len(disc_summary["relevant_disciplines"]) > 0
 
         # Content analysis
@@ -62,15 +50,11 @@ class TestFullPipeline:
         anomalies = content.generate_all_anomalies()
         assert isinstance(anomalies, list)
 
-    def test_multi_agent_with_real_data(self, all_findings):
+    def test_multi_agent_with_real_data(
+        self, amphipolis_postulates, all_findings
+    ):
         """Multi-agent system produces valid output."""
-        from epistemix.core import DynamicPostulates
-
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        system = MultiAgentSystem(post)
+        system = MultiAgentSystem(amphipolis_postulates)
         result = system.run(all_findings)
 
         assert "alpha" in result
@@ -79,57 +63,28 @@ class TestFullPipeline:
         assert result["combined"]["total_anomalies"] >= 0
         assert result["combined"]["known_unknowns"] >= 0
 
-    def test_full_end_to_end(
-        self, cycle_0_findings, cycle_1_findings,
-        cycle_2_findings, cycle_3_findings,
-    ):
+    def test_full_end_to_end(self, amphipolis_view):
         """Full 4-cycle audit with all auxiliary analyses."""
-        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
-        engine.initialize()
-
-        all_cycles = [
-            cycle_0_findings, cycle_1_findings,
-            cycle_2_findings, cycle_3_findings,
-        ]
-        for cycle_findings in all_cycles:
-            engine.ingest_findings(cycle_findings)
-            engine.run_cycle()
-
         # Should have 4 cycle snapshots
-        assert len(engine.cycle_history) == 4
+        assert len(amphipolis_view.cycle_history) == 4
 
         # Coverage should be meaningful
-        final = engine.cycle_history[-1]
+        final = amphipolis_view.cycle_history[-1]
         assert final.coverage_score > 0
 
         # Engine should be serializable
-        d = engine.to_dict()
+        d = amphipolis_view.to_dict
         assert d["cycle"] == 4
         assert len(d["coverage_history"]) == 4
         assert len(d["findings"]) > 0
 
         # Report should be generated
-        report = engine.report()
-        assert "Evolution" in report  # Multi-cycle shows evolution
+        assert "Evolution" in amphipolis_view.report  # Multi-cycle shows evolution
 
-    def test_v3_weighted_postulates_across_cycles(
-        self, cycle_0_findings, cycle_1_findings,
-        cycle_2_findings, cycle_3_findings,
-    ):
+    def test_v3_weighted_postulates_across_cycles(self, amphipolis_view):
         """v3: Weighted postulates accumulate and confidence grows."""
-        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
-        engine.initialize()
-
-        all_cycles = [
-            cycle_0_findings, cycle_1_findings,
-            cycle_2_findings, cycle_3_findings,
-        ]
-        for cycle_findings in all_cycles:
-            engine.ingest_findings(cycle_findings)
-            engine.run_cycle()
-
         # Should have weighted postulates created from all findings
-        wps = engine.postulates.weighted_postulates
+        wps = amphipolis_view.weighted_postulates
         assert len(wps) > 0
 
         # Peristeri appears in many findings → high confidence
@@ -139,27 +94,19 @@ class TestFullPipeline:
         assert wps[peristeri_key].source_count >= 2
 
         # to_dict should include v3 data
-        d = engine.to_dict()
+        d = amphipolis_view.to_dict
         assert len(d["weighted_postulates"]) > 0
         assert any(
             wp["description"] == "Katerina Peristeri"
             for wp in d["weighted_postulates"]
         )
 
-    def test_v3_cycle_snapshots_have_confidence(
-        self, cycle_0_findings, cycle_1_findings,
-    ):
+    def test_v3_cycle_snapshots_have_confidence(self, amphipolis_view):
         """v3: CycleSnapshot includes weighted postulate metrics."""
-        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
-        engine.initialize()
-
-        engine.ingest_findings(cycle_0_findings)
-        snap1 = engine.run_cycle()
+        snap1, snap2 = amphipolis_view.cycle_history[:2]
         assert snap1.weighted_postulates_count > 0
         assert snap1.avg_confidence > 0
 
-        engine.ingest_findings(cycle_1_findings)
-        snap2 = engine.run_cycle()
         # More findings → more postulates
         assert snap2.weighted_postulates_count >= snap1.weighted_postulates_count
 
@@ -223,6 +170,24 @@ class TestSemanticGraphIntegration:
         assert snapshot.relations_count == 1
         assert len(engine.semantic_graph.relations) == 1
 
+    def test_run_cycle_extracts_relations_from_current_batch_only(self):
+        seen: list[list[str]] = []
+
+        class RecordingConnector(MockConnector):
+            def extract_relations(self, findings):
+                seen.append([f.source for f in findings])
+                return super().extract_relations(findings)
+
+        connector = RecordingConnector()
+        engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
+        engine.initialize()
+        engine.ingest_findings([Finding(source="Paper A", language="en")])
+        engine.run_cycle(connector=connector)
+        engine.ingest_findings([Finding(source="Paper B", language="el")])
+        engine.run_cycle(connector=connector)
+
+        assert seen == [["Paper A"], ["Paper B"]]
+
     def test_run_cycle_without_connector_still_works(self):
         """Backward compatibility: no connector = no graph analysis."""
         engine = EpistemixEngine("Greece", "Amphipolis tomb", "archaeology")
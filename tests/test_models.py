@@ -1,5 +1,7 @@
 """Tests for Epistemix data models."""
 
+import pytest
+
 from epistemix.models import (
     AccessTier,
     Anomaly,
@@ -11,18 +13,23 @@ from epistemix.models import (
     Finding,
     GapType,
     LanguageEcosystem,
+    NegativePostulate,
     RelationType,
     SearchQuery,
     SemanticRelation,
     Severity,
+    WeightedPostulate,
 )
 
 
 class TestSeverity:
-    def test_ordering(self):
-        assert Severity.LOW < Severity.MEDIUM
-        assert Severity.MEDIUM < Severity.HIGH
-        assert Severity.HIGH < Severity.CRITICAL
+    @pytest.mark.parametrize("lower, higher", [
+        (Severity.LOW, Severity.MEDIUM),
+        (Severity.MEDIUM, Severity.HIGH),
+        (Severity.HIGH, Severity.CRITICAL),
+    ])
+    def test_ordering(self, lower, higher):
+        assert lower < higher
 
     def test_weight(self):
         assert Severity.LOW.weight == 1
@@ -80,7 +87,9 @@ class TestFinding:
     def test_dedup_same_source_and_language(self):
         a = Finding(source="Paper A", language="en")
         b = Finding(source="paper a", language="en", author="Alice")
+        assert hash(a) == hash(b)
         assert a == b
+        assert len({a, b}) == 1
 
     def test_different_language_not_equal(self):
         a = Finding(source="Paper A", language="en")
@@ -113,7 +122,9 @@ class TestAnomaly:
             description="missing language", gap_type=GapType.LINGUISTIC,
             severity=Severity.MEDIUM,
         )
+        assert hash(a) == hash(b)
         assert a == b
+        assert len({a, b}) == 1
 
     def test_different_gap_type_not_equal(self):
         a = Anomaly(description="X", gap_type=GapType.LINGUISTIC, severity=Severity.HIGH)
@@ -143,24 +154,21 @@ class TestSearchQuery:
 
 class TestWeightedPostulate:
     def test_default_confidence(self):
-        from epistemix.models import WeightedPostulate
         wp = WeightedPostulate(description="Test postulate")
         assert wp.confidence == 0.5
         assert wp.action == "STANDARD"
 
-    def test_action_thresholds(self):
-        from epistemix.models import WeightedPostulate
-        wp = WeightedPostulate(description="Test", confidence=0.1)
-        assert wp.action == "VERIFY"
-        wp.confidence = 0.4
-        assert wp.action == "STANDARD"
-        wp.confidence = 0.75
-        assert wp.action == "RELIABLE"
-        wp.confidence = 0.95
-        assert wp.action == "CONSOLIDATED"
+    @pytest.mark.parametrize("confidence, expected_action", [
+        (0.1, "VERIFY"),
+        (0.4, "STANDARD"),
+        (0.75, "RELIABLE"),
+        (0.95, "CONSOLIDATED"),
+    ])
+    def test_action_thresholds(self, confidence, expected_action):
+        wp = WeightedPostulate(description="Test", confidence=confidence)
+        assert wp.action == expected_action
 
     def test_effective_confidence_no_decay(self):
-        from epistemix.models import WeightedPostulate
         wp = WeightedPostulate(
             description="Test", confidence=0.8,
             decay_rate=0.0, last_confirmed_cycle=1,
@@ -168,7 +176,6 @@ class TestWeightedPostulate:
         assert wp.effective_confidence(5) == 0.8
 
     def test_effective_confidence_with_decay(self):
-        from epistemix.models import WeightedPostulate
         wp = WeightedPostulate(
             description="Test", confidence=0.8,
             decay_rate=0.1, last_confirmed_cycle=0,
@@ -176,18 +183,24 @@ class TestWeightedPostulate:
         # 4 cycles later, 2 cycles per month = 2 months
         eff = wp.effective_confidence(4, cycles_per_month=2.0)
         expected = 0.8 * (0.9 ** 2)  # 0.648
-        assert abs(eff - expected) < 0.001
+        assert eff == pytest.approx(expected, abs=1e-3)
 
     def test_effective_confidence_current_cycle(self):
-        from epistemix.models import WeightedPostulate
         wp = WeightedPostulate(
             description="Test", confidence=0.8,
             decay_rate=0.1, last_confirmed_cycle=3,
         )
         assert wp.effective_confidence(3) == 0.8
 
+    def test_decay_factor(self):
+        wp = WeightedPostulate(
+            description="Test", confidence=0.8,
+            decay_rate=0.1, last_confirmed_cycle=0,
+        )
+        assert wp.decay_factor(0) == 1.0
+        assert wp.decay_factor(4) == pytest.approx(0.81, abs=1e-3)
+
     def test_to_dict(self):
-        from epistemix.models import WeightedPostulate
         wp = WeightedPostulate(
             description="Test", meta_axiom_id="MA-01",
             source_count=3, language_spread=2,
@@ -203,14 +216,12 @@ class TestWeightedPostulate:
 
 class TestNegativePostulate:
     def test_default_values(self):
-        from epistemix.models import NegativePostulate
         np_obj = NegativePostulate(query_text="test query", language="de")
         assert np_obj.attempts == 1
         assert np_obj.possible_reason == ""
         assert np_obj.reformulation == ""
 
     def test_to_dict(self):
-        from epistemix.models import NegativePostulate
         np_obj = NegativePostulate(
             query_text="Amphipolis Ausgrabung",
             language="de",
@@ -11,11 +11,8 @@ from epistemix.models import Finding, GapType
 
 
 class TestAgentInstitutional:
-    def test_audit_returns_report(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-        agent = AgentInstitutional(post)
+    def test_audit_returns_report(self, amphipolis_postulates, all_findings):
+        agent = AgentInstitutional(amphipolis_postulates)
         report = agent.audit(all_findings)
         assert report.agent_name == "Agent \u03b1 (Institutional)"
         assert len(report.expectations) > 0
@@ -35,11 +32,8 @@ class TestAgentInstitutional:
 
 
 class TestAgentTheoretical:
-    def test_audit_returns_report(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-        agent = AgentTheoretical(post)
+    def test_audit_returns_report(self, amphipolis_postulates, all_findings):
+        agent = AgentTheoretical(amphipolis_postulates)
         report = agent.audit(all_findings)
         assert report.agent_name == "Agent \u03b2 (Theoretical)"
         assert len(report.expectations) > 0
@@ -76,62 +70,26 @@ class TestAgentTheoretical:
 
 
 class TestArbiter:
-    def test_finds_discrepancies(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
-
-        arbiter = Arbiter(report_a, report_b)
+    def test_finds_discrepancies(self, amphipolis_agent_reports):
+        arbiter = Arbiter(*amphipolis_agent_reports)
         discrepancies = arbiter.compare()
         # With different focuses, there should be discrepancies
         assert isinstance(discrepancies, list)
 
-    def test_combined_score(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
-
-        arbiter = Arbiter(report_a, report_b)
+    def test_combined_score(self, amphipolis_agent_reports):
+        arbiter = Arbiter(*amphipolis_agent_reports)
         arbiter.compare()
         score = arbiter.combined_score()
         assert 0 <= score <= 100
 
-    def test_report_string(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
-
-        arbiter = Arbiter(report_a, report_b)
+    def test_report_string(self, amphipolis_agent_reports):
+        arbiter = Arbiter(*amphipolis_agent_reports)
         arbiter.compare()
         text = arbiter.report()
         assert "MULTI-AGENT ARBITER REPORT" in text
 
-    def test_to_dict(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        alpha = AgentInstitutional(post)
-        beta = AgentTheoretical(post)
-        report_a = alpha.audit(all_findings)
-        report_b = beta.audit(all_findings)
-
-        arbiter = Arbiter(report_a, report_b)
+    def test_to_dict(self, amphipolis_agent_reports):
+        arbiter = Arbiter(*amphipolis_agent_reports)
         arbiter.compare()
         d = arbiter.to_dict()
         assert "alpha" in d
@@ -141,12 +99,8 @@ class TestArbiter:
 
 
 class TestMultiAgentSystem:
-    def test_run(self, all_findings):
-        post = DynamicPostulates("Greece", "Amphipolis tomb", "archaeology")
-        for f in all_findings:
-            post.ingest_finding(f)
-
-        system = MultiAgentSystem(post)
+    def test_run(self, amphipolis_postulates, all_findings):
+        system = MultiAgentSystem(amphipolis_postulates)
         result = system.run(all_findings)
         assert "alpha" in result
         assert "beta" in result
@@ -1,5 +1,9 @@
 """Tests for query_localization module."""
 
+import re
+
+import pytest
+
 from epistemix.query_localization import (
     localize_query,
     localize_query_via_llm,
@@ -13,18 +17,32 @@ from epistemix.query_localization import (
     KOREAN_TOPIC_TERMS,
 )
 
+# Script-range checks, one regex scan per query
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+_KANJI_OR_KATAKANA_RE = re.compile("[\u4e00-\u9fff\u30a0-\u30ff]")
+_HANGUL_RE = re.compile("[\uac00-\ud7a3]")
+
+
+@pytest.fixture(scope="module")
+def archaeology_queries() -> dict[str, tuple[str, ...]]:
+    """Archaeology queries per supported language, built once per module."""
+    return {
+        lang: tuple(localize_query("archaeology", lang, "archaeology"))
+        for lang in ("ar", "zh", "ja", "ko")
+    }
+
 
 class TestArabicLocalization:
-    def test_arabic_queries_generated(self):
-        queries = localize_query("archaeology", "ar", "archaeology")
+    def test_arabic_queries_generated(self, archaeology_queries):
+        queries = archaeology_queries["ar"]
         assert len(queries) > 0
         # Should contain Arabic script characters
         assert any("\u0627" in q or "\u0628" in q for q in queries), (
             "Arabic queries should contain Arabic script"
         )
 
-    def test_arabic_has_morphological_variants(self):
-        queries = localize_query("archaeology", "ar", "archaeology")
+    def test_arabic_has_morphological_variants(self, archaeology_queries):
+        queries = archaeology_queries["ar"]
         # Multiple queries due to morphological expansion
         assert len(queries) >= 2
 
@@ -37,17 +55,16 @@ class TestArabicLocalization:
 
 
 class TestChineseLocalization:
-    def test_chinese_queries_generated(self):
-        queries = localize_query("archaeology", "zh", "archaeology")
+    def test_chinese_queries_generated(self, archaeology_queries):
+        queries = archaeology_queries["zh"]
         assert len(queries) > 0
 
-    def test_chinese_has_phrasal_compounds(self):
-        queries = localize_query("archaeology", "zh", "archaeology")
+    def test_chinese_has_phrasal_compounds(self, archaeology_queries):
+        queries = archaeology_queries["zh"]
         # Chinese queries should contain CJK characters
-        assert any(
-            any("\u4e00" <= ch <= "\u9fff" for ch in q)
-            for q in queries
-        ), "Chinese queries should contain CJK characters"
+        assert any(map(_CJK_RE.search, queries)), (
+            "Chinese queries should contain CJK characters"
+        )
 
     def test_chinese_academic_terms_exist(self):
         assert len(CHINESE_ACADEMIC_TERMS) > 0
@@ -58,32 +75,30 @@ class TestChineseLocalization:
 
 
 class TestJapaneseLocalization:
-    def test_japanese_queries_generated(self):
-        queries = localize_query("archaeology", "ja", "archaeology")
+    def test_japanese_queries_generated(self, archaeology_queries):
+        queries = archaeology_queries["ja"]
         assert len(queries) > 0
 
-    def test_japanese_has_kanji(self):
-        queries = localize_query("archaeology", "ja", "archaeology")
-        assert any(
-            any("\u4e00" <= ch <= "\u9fff" or "\u30a0" <= ch <= "\u30ff" for ch in q)
-            for q in queries
-        ), "Japanese queries should contain kanji or katakana"
+    def test_japanese_has_kanji(self, archaeology_queries):
+        queries = archaeology_queries["ja"]
+        assert any(map(_KANJI_OR_KATAKANA_RE.search, queries)), (
+            "Japanese queries should contain kanji or katakana"
+        )
 
     def test_japanese_academic_terms_exist(self):
         assert len(JAPANESE_ACADEMIC_TERMS) > 0
 
 
 class TestKoreanLocalization:
-    def test_korean_queries_generated(self):
-        queries = localize_query("archaeology", "ko", "archaeology")
+    def test_korean_queries_generated(self, archaeology_queries):
+        queries = archaeology_queries["ko"]
         assert len(queries) > 0
 
-    def test_korean_has_hangul(self):
-        queries = localize_query("archaeology", "ko", "archaeology")
-        assert any(
-            any("\uac00" <= ch <= "\ud7a3" for ch in q)
-            for q in queries
-        ), "Korean queries should contain Hangul characters"
+    def test_korean_has_hangul(self, archaeology_queries):
+        queries = archaeology_queries["ko"]
+        assert any(map(_HANGUL_RE.search, queries)), (
+            "Korean queries should contain Hangul characters"
+        )
 
     def test_korean_academic_terms_exist(self):
         assert len(KOREAN_ACADEMIC_TERMS) > 0
@@ -4,6 +4,11 @@ Replaces citation_graph with typed semantic relations: SUPPORTS, CONTESTS,
 CONTRADICTS, CITES, EXTENDS, SUPERVISES, COAUTHORS, TRANSLATES.
 """
 
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
 from epistemix.models import (
     Anomaly,
     GapType,
@@ -11,6 +16,15 @@ from epistemix.models import (
     SemanticRelation,
     Severity,
 )
+from epistemix.semantic_graph import ScholarNode, SemanticGraph
+
+# Template for the bulk CITES relations built in loops below; replace()
+# only swaps the endpoints instead of spelling out every field again.
+_CITES_TPL = SemanticRelation(
+    source="", target="",
+    relation=RelationType.CITES,
+    confidence=0.9, evidence="cites", language="en",
+)
 
 
 # ============================================================
@@ -27,7 +41,6 @@ class TestSemanticGraphBasic:
         assert AcademicSchool is not None
 
     def test_add_relations_creates_nodes(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -41,7 +54,6 @@ class TestSemanticGraphBasic:
         assert "bob" in g.nodes
 
     def test_add_relations_updates_degrees(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -60,7 +72,6 @@ class TestSemanticGraphBasic:
         assert g.nodes["carol"].out_degree == 1
 
     def test_add_relations_tracks_languages(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -78,7 +89,6 @@ class TestSemanticGraphBasic:
         assert "fr" in g.nodes["alice"].languages_seen_in
 
     def test_case_insensitive_keys(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -93,11 +103,10 @@ class TestSemanticGraphBasic:
             ),
         ])
         # Should be same node, not two separate nodes
-        assert len([k for k in g.nodes if k.startswith("alice") or k.startswith("ALICE")]) == 1
+        assert g.nodes.keys() == {"alice", "bob"}
         assert g.nodes["alice"].out_degree == 2
 
     def test_summary_returns_correct_stats(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -120,7 +129,6 @@ class TestSemanticGraphBasic:
         assert "relation_types" in s
 
     def test_typed_adjacency_populated(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -141,18 +149,15 @@ class TestSemanticGraphBasic:
         assert RelationType.SUPPORTS in adj["alice"]["bob"]
 
     def test_scholar_node_priority(self):
-        from epistemix.semantic_graph import ScholarNode
         node = ScholarNode(name="Alice", in_degree=6, out_degree=2)
         assert node.priority == 6 / (2 + 1)  # 2.0
 
     def test_scholar_node_priority_investigated(self):
-        from epistemix.semantic_graph import ScholarNode
         node = ScholarNode(name="Alice", in_degree=6, out_degree=2, investigated=True)
         assert node.priority == 0.0
 
     def test_preserves_original_name(self):
         """The node name should preserve original casing."""
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -172,7 +177,6 @@ class TestSchoolDetection:
     """Union-find on SUPPORTS relations."""
 
     def test_mutual_supports_forms_school(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -194,7 +198,6 @@ class TestSchoolDetection:
         assert "bob" in members
 
     def test_no_school_without_supports(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -211,55 +214,46 @@ class TestSchoolDetection:
         schools = g.detect_schools()
         assert len(schools) == 0
 
-    def test_transitive_supports_same_school(self):
-        from epistemix.semantic_graph import SemanticGraph
+    @pytest.mark.parametrize("pairs, expected_sizes, expect_school_gap", [
+        # One transitive chain -> single school -> echo-chamber anomaly
+        ([("Alice", "Bob"), ("Bob", "Carol")], [3], True),
+        # Two components, sorted by size descending
+        ([("Alice", "Bob"), ("Carol", "Dave"), ("Dave", "Eve")], [3, 2], False),
+        # Two schools of equal size -> no SCHOOL_GAP
+        (
+            [("Alice", "Bob"), ("Bob", "Carol"),
+             ("Dave", "Eve"), ("Eve", "Frank")],
+            [3, 3],
+            False,
+        ),
+    ])
+    def test_schools_and_school_gap(
+        self, pairs, expected_sizes, expect_school_gap,
+    ):
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            SemanticRelation(
-                source="Bob", target="Carol",
+                source=src, target=tgt,
                 relation=RelationType.SUPPORTS,
                 confidence=0.9, evidence="supports", language="en",
-            ),
+            )
+            for src, tgt in pairs
         ])
         schools = g.detect_schools()
-        assert len(schools) >= 1
-        # All three should be in the same school
-        assert schools[0].size == 3
+        assert [school.size for school in schools] == expected_sizes
 
-    def test_schools_sorted_by_size_descending(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        # School 1: Alice, Bob (size 2)
-        g.add_relations([
-            SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            # School 2: Carol, Dave, Eve (size 3)
-            SemanticRelation(
-                source="Carol", target="Dave",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            SemanticRelation(
-                source="Dave", target="Eve",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-        ])
-        schools = g.detect_schools()
-        assert len(schools) == 2
-        assert schools[0].size >= schools[1].size
+        school_anomalies = [
+            a for a in g.generate_anomalies()
+            if a.gap_type == GapType.SCHOOL_GAP
+        ]
+        if expect_school_gap:
+            assert len(school_anomalies) == 1
+            assert school_anomalies[0].severity == Severity.CRITICAL
+        else:
+            assert len(school_anomalies) == 0
 
     def test_one_way_supports_still_forms_school(self):
         """SUPPORTS is union-find based, so one-way A->B is enough to link."""
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -280,50 +274,27 @@ class TestSchoolDetection:
 class TestFractureDetection:
     """CONTESTS/CONTRADICTS pairs."""
 
-    def test_contests_is_fracture(self):
-        from epistemix.semantic_graph import SemanticGraph
+    @pytest.mark.parametrize("relation, n_fractures", [
+        (RelationType.CONTESTS, 1),
+        (RelationType.CONTRADICTS, 1),
+        (RelationType.CITES, 0),
+    ], ids=["contests", "contradicts", "cites"])
+    def test_relation_type_fracture(self, relation, n_fractures):
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
                 source="Alice", target="Bob",
-                relation=RelationType.CONTESTS,
-                confidence=0.9, evidence="contests", language="en",
+                relation=relation,
+                confidence=0.9, evidence=relation.value, language="en",
             ),
         ])
         fractures = g.detect_fractures()
-        assert len(fractures) == 1
-        pair = fractures[0]
-        assert "alice" in pair and "bob" in pair
-
-    def test_contradicts_is_fracture(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        g.add_relations([
-            SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.CONTRADICTS,
-                confidence=0.9, evidence="contradicts", language="en",
-            ),
-        ])
-        fractures = g.detect_fractures()
-        assert len(fractures) == 1
-
-    def test_cites_not_a_fracture(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        g.add_relations([
-            SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            ),
-        ])
-        fractures = g.detect_fractures()
-        assert len(fractures) == 0
+        assert len(fractures) == n_fractures
+        for pair in fractures:
+            assert "alice" in pair and "bob" in pair
 
     def test_deduplicates_fracture_pairs(self):
         """(Alice, Bob) and (Bob, Alice) should be one fracture."""
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -345,27 +316,31 @@ class TestFractureDetection:
 # TestAuthorityDetection
 # ============================================================
 
+@pytest.fixture(scope="module")
+def authority_graph() -> SemanticGraph:
+    """BigScholar with 5 CITES and MediumScholar with 3, built once.
+
+    detect_authority() only reads the graph; do not add relations to it.
+    """
+    g = SemanticGraph()
+    g.add_relations([
+        *(replace(_CITES_TPL, source=f"Author{i}", target="BigScholar")
+          for i in range(5)),
+        *(replace(_CITES_TPL, source=f"Other{i}", target="MediumScholar")
+          for i in range(3)),
+    ])
+    return g
+
+
 class TestAuthorityDetection:
     """High CITES in-degree."""
 
-    def test_five_cites_is_authority(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        relations = [
-            SemanticRelation(
-                source=f"Author{i}", target="BigScholar",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            )
-            for i in range(5)
-        ]
-        g.add_relations(relations)
-        authorities = g.detect_authority(min_cites=3)
+    def test_five_cites_is_authority(self, authority_graph):
+        authorities = authority_graph.detect_authority(min_cites=3)
         names = [a.name for a in authorities]
         assert "BigScholar" in names
 
     def test_one_cite_not_authority(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -377,32 +352,15 @@ class TestAuthorityDetection:
         authorities = g.detect_authority(min_cites=3)
         assert len(authorities) == 0
 
-    def test_authority_sorted_by_in_degree(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
+    def test_authority_sorted_by_in_degree(self, authority_graph):
         # BigScholar gets 5 CITES, MediumScholar gets 3
-        relations = []
-        for i in range(5):
-            relations.append(SemanticRelation(
-                source=f"Author{i}", target="BigScholar",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            ))
-        for i in range(3):
-            relations.append(SemanticRelation(
-                source=f"Other{i}", target="MediumScholar",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            ))
-        g.add_relations(relations)
-        authorities = g.detect_authority(min_cites=3)
+        authorities = authority_graph.detect_authority(min_cites=3)
         assert len(authorities) == 2
         assert authorities[0].name == "BigScholar"
         assert authorities[1].name == "MediumScholar"
 
     def test_supports_not_counted_as_cites(self):
         """SUPPORTS should not count toward CITES authority."""
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         relations = [
             SemanticRelation(
@@ -425,7 +383,6 @@ class TestIsolatedDetection:
     """Nodes with no relations at all."""
 
     def test_node_with_no_relations_is_isolated(self):
-        from epistemix.semantic_graph import SemanticGraph, ScholarNode
         g = SemanticGraph()
         # Manually add a node that has no relations
         g.nodes["lonely"] = ScholarNode(name="Lonely")
@@ -441,7 +398,6 @@ class TestIsolatedDetection:
         assert "Lonely" in names
 
     def test_connected_node_not_isolated(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -460,11 +416,34 @@ class TestIsolatedDetection:
 # TestInfluenceChains
 # ============================================================
 
+@pytest.fixture(scope="module")
+def long_chain_graph() -> SemanticGraph:
+    """A -SUPERVISES-> B -EXTENDS-> C -SUPERVISES-> D, built once."""
+    g = SemanticGraph()
+    g.add_relations([
+        SemanticRelation(
+            source="A", target="B",
+            relation=RelationType.SUPERVISES,
+            confidence=0.9, evidence="supervises", language="en",
+        ),
+        SemanticRelation(
+            source="B", target="C",
+            relation=RelationType.EXTENDS,
+            confidence=0.9, evidence="extends", language="en",
+        ),
+        SemanticRelation(
+            source="C", target="D",
+            relation=RelationType.SUPERVISES,
+            confidence=0.9, evidence="supervises", language="en",
+        ),
+    ])
+    return g
+
+
 class TestInfluenceChains:
     """SUPERVISES/EXTENDS paths."""
 
     def test_supervises_extends_chain(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -485,7 +464,6 @@ class TestInfluenceChains:
         assert len(long_chains) >= 1
 
     def test_below_min_length_no_chain(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -498,7 +476,6 @@ class TestInfluenceChains:
         assert len(chains) == 0
 
     def test_cites_not_counted_in_chains(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -517,29 +494,19 @@ class TestInfluenceChains:
         long_chains = [c for c in chains if len(c) >= 3]
         assert len(long_chains) == 0
 
-    def test_long_influence_chain(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        g.add_relations([
-            SemanticRelation(
-                source="A", target="B",
-                relation=RelationType.SUPERVISES,
-                confidence=0.9, evidence="supervises", language="en",
-            ),
-            SemanticRelation(
-                source="B", target="C",
-                relation=RelationType.EXTENDS,
-                confidence=0.9, evidence="extends", language="en",
-            ),
-            SemanticRelation(
-                source="C", target="D",
-                relation=RelationType.SUPERVISES,
-                confidence=0.9, evidence="supervises", language="en",
-            ),
-        ])
-        chains = g.detect_influence_chains(min_length=2)
-        # Should find A->B->C->D chain
-        assert any(len(c) == 4 for c in chains)
+    @pytest.mark.parametrize("min_length, expect_full_chain", [
+        (2, True),
+        (3, True),
+        (4, False),
+    ])
+    def test_long_influence_chain(
+        self, long_chain_graph, min_length, expect_full_chain,
+    ):
+        chains = long_chain_graph.detect_influence_chains(
+            min_length=min_length,
+        )
+        # A->B->C->D has 3 edges, so it clears min_length up to 3
+        assert any(len(c) == 4 for c in chains) is expect_full_chain
 
 
 # ============================================================
@@ -550,7 +517,6 @@ class TestUnmappedPairs:
     """Entities with no relation between them."""
 
     def test_entities_without_relation_are_unmapped(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         # 4 entities. Alice<->Bob related. Carol<->Dave related.
         # Alice and Carol both have >= 2 mentions but NO relation.
@@ -581,7 +547,7 @@ class TestUnmappedPairs:
         # Related: Alice-Bob, Carol-Dave
         # Unmapped: Alice-Carol, Alice-Dave, Bob-Carol, Bob-Dave
         unmapped = g.detect_unmapped_pairs(min_mentions=2)
-        pair_sets = [frozenset(p) for p in unmapped]
+        pair_sets = {frozenset(p) for p in unmapped}
         assert frozenset(("alice", "carol")) in pair_sets
         assert frozenset(("alice", "dave")) in pair_sets
         assert frozenset(("bob", "carol")) in pair_sets
@@ -591,7 +557,6 @@ class TestUnmappedPairs:
         assert frozenset(("carol", "dave")) not in pair_sets
 
     def test_related_entities_not_unmapped(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         # Create enough relations so both Alice and Bob have >= 2 mentions
         g.add_relations([
@@ -608,7 +573,7 @@ class TestUnmappedPairs:
         ])
         # Alice and Bob both have 2 mentions and ARE related
         unmapped = g.detect_unmapped_pairs(min_mentions=2)
-        pair_sets = [frozenset(p) for p in unmapped]
+        pair_sets = {frozenset(p) for p in unmapped}
         assert frozenset(("alice", "bob")) not in pair_sets
 
 
@@ -620,7 +585,6 @@ class TestAnomalyGeneration:
     """Combine all detectors into anomalies."""
 
     def test_fracture_generates_fracture_line_anomaly(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         g.add_relations([
             SemanticRelation(
@@ -637,99 +601,28 @@ class TestAnomalyGeneration:
         assert fracture_anomalies[0].severity == Severity.MEDIUM
 
     def test_high_citation_uninvestigated_generates_citation_island(self):
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         relations = [
-            SemanticRelation(
-                source=f"Author{i}", target="MysteryScholar",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            )
+            replace(_CITES_TPL, source=f"Author{i}", target="MysteryScholar")
             for i in range(5)
         ]
         g.add_relations(relations)
         # MysteryScholar has 5 CITES in-degree and is not investigated
-        anomalies = g.generate_anomalies()
-        citation_anomalies = [
-            a for a in anomalies if a.gap_type == GapType.CITATION_ISLAND
-        ]
-        assert len(citation_anomalies) >= 1
-        assert citation_anomalies[0].severity == Severity.HIGH
-
-    def test_single_school_generates_school_gap(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        # Create one school of size 3
-        g.add_relations([
-            SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            SemanticRelation(
-                source="Bob", target="Carol",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-        ])
-        schools = g.detect_schools()
-        assert len(schools) == 1
-        assert schools[0].size >= 3
-        anomalies = g.generate_anomalies()
-        school_anomalies = [
-            a for a in anomalies if a.gap_type == GapType.SCHOOL_GAP
+        islands = [
+            a for a in g.generate_anomalies()
+            if a.gap_type == GapType.CITATION_ISLAND
         ]
-        assert len(school_anomalies) >= 1
-        assert school_anomalies[0].severity == Severity.CRITICAL
-
-    def test_two_schools_no_school_gap(self):
-        from epistemix.semantic_graph import SemanticGraph
-        g = SemanticGraph()
-        g.add_relations([
-            SemanticRelation(
-                source="Alice", target="Bob",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            SemanticRelation(
-                source="Bob", target="Carol",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            # Second school
-            SemanticRelation(
-                source="Dave", target="Eve",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-            SemanticRelation(
-                source="Eve", target="Frank",
-                relation=RelationType.SUPPORTS,
-                confidence=0.9, evidence="supports", language="en",
-            ),
-        ])
-        anomalies = g.generate_anomalies()
-        school_anomalies = [
-            a for a in anomalies if a.gap_type == GapType.SCHOOL_GAP
-        ]
-        assert len(school_anomalies) == 0
+        assert len(islands) >= 1
+        assert islands[0].severity == Severity.HIGH
 
     def test_investigated_authority_no_citation_island(self):
         """If the highly-cited scholar IS investigated, no anomaly."""
-        from epistemix.semantic_graph import SemanticGraph
         g = SemanticGraph()
         relations = [
-            SemanticRelation(
-                source=f"Author{i}", target="KnownScholar",
-                relation=RelationType.CITES,
-                confidence=0.9, evidence="cites", language="en",
-            )
+            replace(_CITES_TPL, source=f"Author{i}", target="KnownScholar")
             for i in range(5)
         ]
         g.add_relations(relations)
         g.nodes["knownscholar"].investigated = True
-        anomalies = g.generate_anomalies()
-        citation_anomalies = [
-            a for a in anomalies if a.gap_type == GapType.CITATION_ISLAND
-        ]
-        assert len(citation_anomalies) == 0
+        gap_counts = Counter(a.gap_type for a in g.generate_anomalies())
+        assert gap_counts[GapType.CITATION_ISLAND] == 0
@@ -0,0 +1,241 @@
+"""Tests for the Fly.io worker, run against an in-memory Supabase stub."""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from epistemix.connector import MockConnector
+from epistemix.models import Anomaly, Finding, GapType, SearchQuery, Severity
+
+WORKER_DIR = Path(__file__).resolve().parent.parent / "worker"
+
+# Columns from supabase/migrations/003_findings_anomalies.sql
+AUDIT_FINDINGS_COLUMNS = {
+    "audit_id", "name", "finding_type", "description", "source_query",
+    "language", "citations", "metadata", "discovered_at_cycle",
+}
+AUDIT_ANOMALIES_COLUMNS = {
+    "audit_id", "anomaly_type", "severity", "description",
+    "suggested_queries", "related_postulate_id", "detected_at_cycle",
+    "resolved",
+}
+
+
+class _FakeQuery:
+    def __init__(self, client: "_FakeClient", call: tuple) -> None:
+        self._client = client
+        self._call = call
+
+    def eq(self, column: str, value: str) -> "_FakeQuery":
+        return self
+
+    def execute(self) -> None:
+        if self._call[0] in self._client.failing:
+            raise RuntimeError(f"{self._call[0]} unavailable")
+        self._client.calls.append(self._call)
+
+
+class _FakeTable:
+    def __init__(self, client: "_FakeClient", name: str) -> None:
+        self._client = client
+        self._name = name
+
+    def insert(self, rows):
+        return _FakeQuery(self._client, (self._name, "insert", rows))
+
+    def update(self, data: dict):
+        return _FakeQuery(self._client, (self._name, "update", data))
+
+
+class _FakeClient:
+    """Records every executed request as (target, operation, payload).
+
+    Requests to a target named in failing raise instead.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.failing: set[str] = set()
+
+    def table(self, name: str) -> _FakeTable:
+        return _FakeTable(self, name)
+
+    def rpc(self, fn: str, params: dict) -> _FakeQuery:
+        return _FakeQuery(self, (fn, "rpc", params))
+
+
+@pytest.fixture
+def fake_client() -> _FakeClient:
+    return _FakeClient()
+
+
+@pytest.fixture
+def worker(monkeypatch, fake_client):
+    """The worker's main module, importing a stub supabase package."""
+    stub = types.ModuleType("supabase")
+    stub.Client = _FakeClient
+    stub.create_client = lambda url, key: fake_client
+    monkeypatch.setitem(sys.modules, "supabase", stub)
+    monkeypatch.syspath_prepend(str(WORKER_DIR))
+    monkeypatch.setenv("SUPABASE_URL", "http://localhost")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
+    yield importlib.import_module("main")
+    for name in ("main", "supabase_writer"):
+        sys.modules.pop(name, None)
+
+
+def _inserted(client: _FakeClient, table: str) -> list[dict]:
+    return [
+        row
+        for target, op, rows in client.calls
+        if target == table and op == "insert"
+        for row in rows
+    ]
+
+
+class TestDetailedRows:
+    def test_finding_rows_from_serialize_finding(self, worker, fake_client):
+        finding = Finding(
+            source="Kasta Hill excavation report", language="el",
+            author="Peristeri", source_type="report", year=2014,
+            entities_mentioned=["Kasta Hill"], cycle=1,
+        )
+        writer = worker.SupabaseWriter("audit-1")
+        writer.write_detailed_findings(
+            "audit-1", [worker.serialize_finding(finding)],
+        )
+        writer.flush()
+
+        [row] = _inserted(fake_client, "audit_findings")
+        assert row.keys() <= AUDIT_FINDINGS_COLUMNS
+        assert row["name"] == "Kasta Hill excavation report"
+        assert row["finding_type"] == "report"
+        assert row["language"] == "el"
+        assert row["discovered_at_cycle"] == 1
+        assert row["metadata"]["author"] == "Peristeri"
+        assert row["metadata"]["entities_mentioned"] == ["Kasta Hill"]
+
+    def test_anomaly_rows_from_serialize_anomaly(self, worker, fake_client):
+        anomaly = Anomaly(
+            description="No sources in Turkish",
+            gap_type=GapType.LINGUISTIC,
+            severity=Severity.LOW,
+            suggested_queries=["Amfipolis mezarı"],
+            detected_at_cycle=2,
+            language="tr",
+        )
+        serialized = worker.serialize_anomaly(anomaly)
+        assert serialized["language"] == "tr"
+        writer = worker.SupabaseWriter("audit-1")
+        writer.write_detailed_anomalies("audit-1", [serialized])
+        writer.flush()
+
+        [row] = _inserted(fake_client, "audit_anomalies")
+        assert row.keys() <= AUDIT_ANOMALIES_COLUMNS
+        assert row["anomaly_type"] == GapType.LINGUISTIC.value
+        assert row["severity"] == "low"
+        assert row["suggested_queries"] == ["Amfipolis mezarı"]
+        assert row["detected_at_cycle"] == 2
+
+    def test_no_rows_no_request(self, worker, fake_client):
+        writer = worker.SupabaseWriter("audit-1")
+        writer.write_detailed_findings("audit-1", [])
+        writer.write_detailed_anomalies("audit-1", [])
+        writer.flush()
+        assert fake_client.calls == []
+
+
+class TestWriterLifecycle:
+    def test_update_status_raises_queued_failure(self, worker, fake_client):
+        fake_client.failing.add("audit_findings")
+        writer = worker.SupabaseWriter("audit-1")
+        writer.write_detailed_findings("audit-1", [worker.serialize_finding(
+            Finding(source="Kasta Hill excavation report", language="el"),
+        )])
+        with pytest.raises(RuntimeError, match="audit_findings"):
+            writer.update_status("complete")
+        assert fake_client.calls == []
+        writer.close()
+
+    def test_failed_status_written_despite_queued_failure(
+        self, worker, fake_client,
+    ):
+        fake_client.failing.add("usage_records")
+        writer = worker.SupabaseWriter("audit-1")
+        writer.record_usage("user-1", "audit")
+        writer.update_status("failed", error_message="boom")
+        writer.close()
+        [(_, _, data)] = fake_client.calls
+        assert data["status"] == "failed"
+
+    def test_close_stops_background_thread(self, worker, fake_client):
+        writer = worker.SupabaseWriter("audit-1")
+        writer.write_postulates([])
+        writer.close()
+        assert fake_client.calls == [("audits", "update", {"postulates": []})]
+        with pytest.raises(RuntimeError):
+            writer.write_postulates([])
+
+
+@pytest.fixture
+def run_main(worker, monkeypatch):
+    """Run the worker's main() for two cycles over a small mock corpus."""
+    connector = MockConnector()
+    connector.register_findings("amphipolis", [
+        Finding(source="Kasta Hill excavation report", language="el",
+                author="Peristeri", source_type="report"),
+        Finding(source="The Amphipolis tomb", language="en",
+                author="Chugg", theory_supported="Hephaestion"),
+    ])
+    monkeypatch.setattr(worker, "create_connector", lambda: connector)
+    monkeypatch.setenv("AUDIT_ID", "audit-1")
+    monkeypatch.setenv("AUDIT_TOPIC", "Amphipolis tomb")
+    monkeypatch.setenv("AUDIT_COUNTRY", "Greece")
+    monkeypatch.setenv("AUDIT_DISCIPLINE", "archaeology")
+    monkeypatch.setenv("AUDIT_MAX_CYCLES", "2")
+    return worker.main
+
+
+class TestMain:
+    def test_writes_every_cycle_then_completes(self, run_main, fake_client):
+        run_main()
+
+        progress = [c for c in fake_client.calls if c[1] == "rpc"]
+        assert [params["p_cycle"] for _, _, params in progress] == [1, 2]
+        updates = [data for _, op, data in fake_client.calls if op == "update"]
+        assert any("multi_agent_result" in data for data in updates)
+        assert updates[-1]["status"] == "complete"
+        # Each cycle's new findings reach audit_findings as well as the
+        # audits row; Phase 3 adds the final gap-filling batch.
+        streamed = sum(len(params["p_new_findings"]) for _, _, params in progress)
+        assert len(_inserted(fake_client, "audit_findings")) >= streamed > 0
+
+    def test_failed_write_marks_audit_failed(self, run_main, fake_client):
+        fake_client.failing.add("audit_findings")
+        with pytest.raises(SystemExit):
+            run_main()
+        updates = [data for _, op, data in fake_client.calls if op == "update"]
+        assert updates[-1]["status"] == "failed"
+        assert "audit_findings" in updates[-1]["error_message"]
+        assert all(data.get("status") != "complete" for data in updates)
+
+    def test_create_connector_reads_max_concurrency(
+        self, worker, fake_anthropic, monkeypatch,
+    ):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        monkeypatch.setenv("MAX_CONCURRENCY", "5")
+        monkeypatch.setenv("MAX_BUDGET", "0.03")
+        connector = worker.create_connector()
+        # Slow calls, so all five in the window start before any is billed
+        queries = [
+            SearchQuery(query=f"slow:0.05 q{i}", language="en")
+            for i in range(5)
+        ]
+        # Sequential execution would stop after two $0.018 calls; one
+        # concurrent window of five runs before the budget is rechecked.
+        findings = connector.execute_batch(queries)
+        assert len(findings) == len(fake_anthropic.calls) == 5
+
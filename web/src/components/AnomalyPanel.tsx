@@ -10,6 +10,7 @@ const SEVERITY_STYLES: Record<string, { border: string; text: string; icon: stri
   critical: { border: "var(--danger)", text: "var(--danger)", icon: "!!" },
   high: { border: "var(--warning)", text: "var(--warning)", icon: "!" },
   medium: { border: "var(--text-ghost)", text: "var(--text-secondary)", icon: "~" },
+  low: { border: "var(--border-subtle)", text: "var(--text-tertiary)", icon: "·" },
 };
 
 const TYPE_LABELS: Record<string, string> = {
@@ -33,14 +34,15 @@ export default function AnomalyPanel({ anomalies }: Props) {
   }
 
   const sorted = [...anomalies].sort((a, b) => {
-    const order = { critical: 0, high: 1, medium: 2 };
-    return (order[a.severity] ?? 3) - (order[b.severity] ?? 3);
+    const order = { critical: 0, high: 1, medium: 2, low: 3 };
+    return (order[a.severity] ?? 4) - (order[b.severity] ?? 4);
   });
 
   const counts = {
     critical: anomalies.filter((a) => a.severity === "critical").length,
     high: anomalies.filter((a) => a.severity === "high").length,
     medium: anomalies.filter((a) => a.severity === "medium").length,
+    low: anomalies.filter((a) => a.severity === "low").length,
   };
 
   return (
@@ -57,6 +59,9 @@ export default function AnomalyPanel({ anomalies }: Props) {
           {counts.medium > 0 && (
             <span className="badge medium">{counts.medium} medium</span>
           )}
+          {counts.low > 0 && (
+            <span className="badge low">{counts.low} low</span>
+          )}
         </div>
       </div>
 
@@ -141,6 +146,10 @@ export default function AnomalyPanel({ anomalies }: Props) {
           background: rgba(255,255,255,0.02);
           color: var(--text-tertiary);
         }
+        .badge.low {
+          background: transparent;
+          color: var(--text-ghost);
+        }
         .list {
           display: flex;
           flex-direction: column;
@@ -10,7 +10,7 @@ interface Props {
 /**
  * Interactive force-directed citation graph using D3.
  * Shows scholars as nodes, citations as edges.
- * Node size = citation count. Color = finding type.
+ * Node size = citation count. Color = source type (finding_type).
  */
 export default function CitationGraph({ findings }: Props) {
   const svgRef = useRef<SVGSVGElement>(null);
@@ -55,6 +55,11 @@ export default function CitationGraph({ findings }: Props) {
         evidence: "var(--chart-5)",
         publication: "var(--chart-4)",
         method: "var(--chart-6)",
+        // finding_type carries the engine's Finding.source_type
+        peer_reviewed: "var(--chart-2)",
+        institutional: "var(--chart-3)",
+        news: "var(--chart-4)",
+        journalistic: "var(--chart-4)",
       };
 
       const simulation = d3
@@ -303,7 +303,7 @@ export interface CoveragePoint {
 
 export interface FindingData {
   name: string;
-  finding_type: string;
+  finding_type: string; // Finding.source_type, e.g. "peer_reviewed"
   description: string;
   source_query: string;
   language: string;
@@ -323,7 +323,7 @@ export interface PostulateData {
 export interface AnomalyData {
   id: string;
   anomaly_type: string;
-  severity: "critical" | "high" | "medium";
+  severity: "critical" | "high" | "medium" | "low";
   description: string;
   suggested_queries: string[];
   related_postulate_id: string;
@@ -26,6 +26,7 @@ def create_connector() -> BaseConnector:
             api_key=api_key,
             model=os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-20250514"),
             max_budget=float(os.environ.get("MAX_BUDGET", "10.0")),
+            max_concurrency=int(os.environ.get("MAX_CONCURRENCY", "1")),
         )
     else:
         # Fallback to mock for development/testing
@@ -55,6 +56,7 @@ def serialize_anomaly(a: Anomaly) -> dict:
         "recommendation": a.recommendation,
         "suggested_queries": a.suggested_queries,
         "detected_at_cycle": a.detected_at_cycle,
+        "language": a.language,
     }
 
 
@@ -87,7 +89,11 @@ def main() -> None:
         seed_findings = connector.execute_batch(queries)
         engine.ingest_findings(seed_findings)
 
-        # Run cycles for real-time progress updates
+        # Run cycles for real-time progress updates. Findings are only
+        # ever appended, so each cycle serializes just the new ones and
+        # sends them to both the audits row and audit_findings.
+        n_findings_sent = 0
+        anomaly_dicts: list[dict] = []
         for cycle in range(max_cycles):
             snapshot = engine.run_cycle()
 
@@ -95,12 +101,18 @@ def main() -> None:
             coverage_history = [
                 s.to_dict() for s in engine.cycle_history
             ]
-            writer.update_cycle(
+            new_finding_dicts = [
+                serialize_finding(f) for f in engine.findings[n_findings_sent:]
+            ]
+            n_findings_sent = len(engine.findings)
+            anomaly_dicts = [serialize_anomaly(a) for a in engine.all_anomalies]
+            writer.write_cycle_progress(
                 cycle=snapshot.cycle,
                 coverage_history=coverage_history,
+                anomalies=anomaly_dicts,
+                new_findings=new_finding_dicts,
             )
-            writer.write_findings([serialize_finding(f) for f in engine.findings])
-            writer.write_anomalies([serialize_anomaly(a) for a in engine.all_anomalies])
+            writer.write_detailed_findings(audit_id, new_finding_dicts)
 
             print(f"Cycle {snapshot.cycle}: coverage={snapshot.coverage_score:.1f}%, "
                   f"findings={snapshot.n_findings}, anomalies={snapshot.n_anomalies}")
@@ -118,6 +130,9 @@ def main() -> None:
                     print(f"Convergence reached at cycle {snapshot.cycle}")
                     break
 
+        # Surface any failed background write before moving on
+        writer.flush()
+
         # --- Phase 2: Multi-agent analysis ---
         print("\nRunning multi-agent analysis...")
         mas = MultiAgentSystem(engine.postulates)
@@ -125,14 +140,15 @@ def main() -> None:
         writer.write_multi_agent_result(multi_result)
 
         # --- Phase 3: Write detailed records ---
+        # Findings from the final gap-filling batch were never sent.
+        # Anomalies only change in run_cycle, so the last cycle's list
+        # is current.
         writer.write_detailed_findings(
             audit_id,
-            [serialize_finding(f) for f in engine.findings],
-        )
-        writer.write_detailed_anomalies(
-            audit_id,
-            [serialize_anomaly(a) for a in engine.all_anomalies],
+            [serialize_finding(f) for f in engine.findings[n_findings_sent:]],
         )
+        writer.write_detailed_anomalies(audit_id, anomaly_dicts)
+        writer.flush()
 
         # --- Done ---
         last_coverage = engine.cycle_history[-1].coverage_score if engine.cycle_history else 0
@@ -143,6 +159,8 @@ def main() -> None:
         traceback.print_exc()
         writer.update_status("failed", error_message=str(e))
         sys.exit(1)
+    finally:
+        writer.close()
 
 
 if __name__ == "__main__":
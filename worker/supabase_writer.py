@@ -8,13 +8,26 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 from typing import Any
 
 from supabase import create_client, Client
 
+# Rows per insert request, to stay well under PostgREST's payload limit
+_INSERT_BATCH_SIZE = 500
+
 
 class SupabaseWriter:
-    """Writes audit progress and results to Supabase."""
+    """Writes audit progress and results to Supabase.
+
+    Every write except update_status is queued on one background thread
+    and runs in call order, so the engine keeps working during the
+    round-trip. A failed request never raises at the call site: flush()
+    and update_status() are where those errors surface. Call close() once
+    the audit is done to stop the background thread.
+    """
 
     def __init__(self, audit_id: str) -> None:
         self.audit_id = audit_id
@@ -22,96 +35,135 @@ class SupabaseWriter:
             os.environ["SUPABASE_URL"],
             os.environ["SUPABASE_SERVICE_ROLE_KEY"],
         )
+        self._background = ThreadPoolExecutor(max_workers=1)
+        self._pending: list[Future[Any]] = []
+
+    def flush(self) -> None:
+        """Wait for queued writes; re-raise the first failure."""
+        pending, self._pending = self._pending, []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """Flush queued writes and stop the background thread."""
+        try:
+            self.flush()
+        finally:
+            self._background.shutdown()
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue fn(*args) on the background thread."""
+        self._pending.append(self._background.submit(fn, *args))
+
+    def _update_audit(self, data: dict[str, Any]) -> None:
+        """Apply a partial update to this audit's row."""
+        self._client.table("audits").update(data).eq("id", self.audit_id).execute()
 
     def update_status(self, status: str, error_message: str = "") -> None:
-        """Update audit status."""
+        """Update audit status.
+
+        Flushes queued writes first, so the final status is never
+        overwritten by an earlier cycle's update, and a failed write
+        stops the audit from being marked complete. A "failed" status is
+        written even if the flush fails too.
+        """
+        try:
+            self.flush()
+        except Exception:
+            if status != "failed":
+                raise
         data: dict[str, Any] = {"status": status}
         if error_message:
             data["error_message"] = error_message
         if status == "running":
-            from datetime import datetime, timezone
             data["started_at"] = datetime.now(timezone.utc).isoformat()
         if status in ("complete", "failed"):
-            from datetime import datetime, timezone
             data["completed_at"] = datetime.now(timezone.utc).isoformat()
 
-        self._client.table("audits").update(data).eq("id", self.audit_id).execute()
+        self._update_audit(data)
 
-    def update_cycle(
+    def write_cycle_progress(
         self,
         cycle: int,
         coverage_history: list[dict],
+        anomalies: list[dict],
+        new_findings: list[dict] | None = None,
     ) -> None:
-        """Update current cycle progress — triggers Realtime push."""
-        self._client.table("audits").update({
-            "current_cycle": cycle,
-            "coverage_history": coverage_history,
-        }).eq("id", self.audit_id).execute()
-
-    def write_findings(self, findings: list[dict]) -> None:
-        """Write findings to the audits JSONB column."""
-        self._client.table("audits").update({
-            "findings": findings,
-        }).eq("id", self.audit_id).execute()
-
-    def write_anomalies(self, anomalies: list[dict]) -> None:
-        """Write anomalies to the audits JSONB column."""
-        self._client.table("audits").update({
-            "anomalies": anomalies,
-        }).eq("id", self.audit_id).execute()
+        """Queue a cycle's progress, findings and anomalies as one update.
+
+        One round-trip and one Realtime push per cycle. Goes through the
+        record_cycle_progress function, which appends new_findings to the
+        stored column instead of re-sending it whole.
+        """
+        query = self._client.rpc("record_cycle_progress", {
+            "p_audit_id": self.audit_id,
+            "p_cycle": cycle,
+            "p_coverage_history": coverage_history,
+            "p_anomalies": anomalies,
+            "p_new_findings": new_findings or [],
+        })
+        self._submit(query.execute)
 
     def write_postulates(self, postulates: list[dict]) -> None:
-        """Write postulates to the audits JSONB column."""
-        self._client.table("audits").update({
-            "postulates": postulates,
-        }).eq("id", self.audit_id).execute()
+        """Queue postulates for the audits JSONB column."""
+        self._submit(self._update_audit, {"postulates": postulates})
 
     def write_multi_agent_result(self, result: dict) -> None:
-        """Write multi-agent analysis result."""
-        self._client.table("audits").update({
-            "multi_agent_result": result,
-        }).eq("id", self.audit_id).execute()
+        """Queue the multi-agent analysis result."""
+        self._submit(self._update_audit, {"multi_agent_result": result})
 
     def write_detailed_findings(self, audit_id: str, findings: list[dict]) -> None:
-        """Write individual findings to the audit_findings table."""
-        rows = []
-        for f in findings:
-            rows.append({
+        """Queue findings, as built by serialize_finding, for audit_findings."""
+        rows = [
+            {
                 "audit_id": audit_id,
-                "name": f["name"],
-                "finding_type": f["finding_type"],
-                "description": f.get("description", ""),
-                "source_query": f.get("source_query", ""),
-                "language": f.get("language", "en"),
-                "citations": f.get("citations", []),
-                "metadata": f.get("metadata", {}),
-                "discovered_at_cycle": f.get("discovered_at_cycle", 0),
-            })
+                "name": f["source"],
+                "finding_type": f["source_type"],
+                "language": f["language"],
+                "metadata": {
+                    "author": f["author"],
+                    "institution": f["institution"],
+                    "theory_supported": f["theory_supported"],
+                    "year": f["year"],
+                    "entities_mentioned": f["entities_mentioned"],
+                },
+                "discovered_at_cycle": f["cycle"],
+            }
+            for f in findings
+        ]
         if rows:
-            self._client.table("audit_findings").insert(rows).execute()
+            self._submit(self._insert_batched, "audit_findings", rows)
 
     def write_detailed_anomalies(self, audit_id: str, anomalies: list[dict]) -> None:
-        """Write individual anomalies to the audit_anomalies table."""
-        rows = []
-        for a in anomalies:
-            rows.append({
+        """Queue anomalies, as built by serialize_anomaly, for audit_anomalies."""
+        rows = [
+            {
                 "audit_id": audit_id,
-                "anomaly_type": a["anomaly_type"],
+                "anomaly_type": a["gap_type"],
                 "severity": a["severity"],
                 "description": a["description"],
-                "suggested_queries": a.get("suggested_queries", []),
-                "related_postulate_id": a.get("related_postulate_id", ""),
-                "detected_at_cycle": a.get("detected_at_cycle", 0),
-                "resolved": a.get("resolved", False),
-            })
+                "suggested_queries": a["suggested_queries"],
+                "detected_at_cycle": a["detected_at_cycle"],
+            }
+            for a in anomalies
+        ]
         if rows:
-            self._client.table("audit_anomalies").insert(rows).execute()
+            self._submit(self._insert_batched, "audit_anomalies", rows)
+
+    def _insert_batched(self, table: str, rows: list[dict]) -> None:
+        """Insert rows into a table in chunks of _INSERT_BATCH_SIZE."""
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            self._client.table(table).insert(
+                rows[start:start + _INSERT_BATCH_SIZE],
+            ).execute()
 
     def record_usage(self, user_id: str, event_type: str, metadata: dict | None = None) -> None:
-        """Record a usage event for billing."""
-        self._client.table("usage_records").insert({
+        """Queue a usage event for billing."""
+        query = self._client.table("usage_records").insert({
             "user_id": user_id,
             "audit_id": self.audit_id,
             "event_type": event_type,
             "metadata": metadata or {},
-        }).execute()
+        })
+        self._submit(query.execute)